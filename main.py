@@ -1,5 +1,6 @@
 """Main entry point for Startup Research Agent System."""
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -7,11 +8,19 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.crew_orchestration import StartupResearchCrew
-from src.database.db import init_database, get_all_startups, get_startups_by_tier
+from src.database.db import init_database
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Startup Research Agent System")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Run per-startup analyses through the OpenAI Batch API (cheaper, slower)"
+    )
+    args = parser.parse_args()
+
     print("\n" + "="*70)
     print("🚀 STARTUP RESEARCH AGENT SYSTEM")
     print("="*70 + "\n")
@@ -22,7 +31,7 @@ def main():
     
     # Create and run crew
     print("🤖 Creating crew...\n")
-    crew = StartupResearchCrew()
+    crew = StartupResearchCrew(use_batch=args.batch)
     result = crew.run()
     
     # Display results
@@ -30,17 +39,18 @@ def main():
         print("\n✅ Execution successful!")
         print(f"Run ID: {result['run_id']}")
         
-        # Get results from database
-        all_startups = get_all_startups()
-        print(f"\n📊 Total startups in database: {len(all_startups)}")
+        # Counts were computed once when the run saved its results
+        summary = result['summary']
+        print(f"\n📊 Total startups in database: {summary['total']}")
         
         # Show by tier
-        for tier in ["Tier 1", "Tier 2", "Tier 3"]:
-            tier_startups = get_startups_by_tier(tier)
-            print(f"  {tier}: {len(tier_startups)} startups")
+        for tier, count in summary['tier_counts'].items():
+            print(f"  {tier}: {count} startups")
     else:
         print(f"\n❌ Execution failed: {result.get('error')}")
     
+    # Reports and email are finalized in the background
+    crew.wait_for_background()
     print("\n" + "="*70 + "\n")
 
 
@@ -1,20 +1,28 @@
 """CrewAI agents for startup research."""
 
 import logging
-from crewai import Agent
-from ..config.settings import LLM_MODEL_SMART, LLM_MODEL_FAST
-from ..tools.crew_tools import (
-    search_recent_startups_tool,
-    search_google_tool,
-    search_product_hunt_tool,
-    fetch_url_content_tool
-)
+from typing import TYPE_CHECKING
+from ..config.settings import LLM_MODEL_SMART, LLM_MODEL_FAST, REPORT_MAX_TOKENS
+
+if TYPE_CHECKING:
+    from crewai import Agent
+
+# crewai and the tool instances are imported inside each factory so that
+# importing this module (e.g. from tests or the CLI) stays cheap
 
 logger = logging.getLogger(__name__)
 
 
-def create_discovery_agent() -> Agent:
+def create_discovery_agent() -> "Agent":
     """Create the startup discovery agent."""
+    from crewai import Agent
+    from ..tools.crew_tools import (
+        search_recent_startups_tool,
+        search_google_tool,
+        search_product_hunt_tool,
+        fetch_url_content_tool
+    )
+
     return Agent(
         role="Global Startup Discovery Agent",
         goal="Find and research startups founded in the last 1 month globally",
@@ -33,8 +41,11 @@ def create_discovery_agent() -> Agent:
     )
 
 
-def create_market_fit_agent() -> Agent:
+def create_market_fit_agent() -> "Agent":
     """Create the India market fit analyzer agent."""
+    from crewai import Agent
+    from ..tools.crew_tools import search_google_tool, fetch_url_content_tool
+
     return Agent(
         role="India Market Fit Analyzer",
         goal="Analyze startups for their viability and fit in the Indian market",
@@ -51,8 +62,11 @@ def create_market_fit_agent() -> Agent:
     )
 
 
-def create_tier_agent() -> Agent:
+def create_tier_agent() -> "Agent":
     """Create the tier categorization agent."""
+    from crewai import Agent
+    from ..tools.crew_tools import search_google_tool, fetch_url_content_tool
+
     return Agent(
         role="Tier Categorization Agent",
         goal="Categorize startups by Indian city tiers (Tier 1, 2, 3)",
@@ -69,8 +83,10 @@ def create_tier_agent() -> Agent:
     )
 
 
-def create_report_agent() -> Agent:
+def create_report_agent() -> "Agent":
     """Create the report generation agent."""
+    from crewai import Agent, LLM
+
     return Agent(
         role="Report Generation Agent",
         goal="Generate comprehensive monthly summary reports",
@@ -78,7 +94,7 @@ def create_report_agent() -> Agent:
         You excel at synthesizing information, identifying trends, and providing actionable insights.
         You format reports in JSON for easy consumption and analysis.""",
         tools=[],
-        model=LLM_MODEL_FAST,
+        llm=LLM(model=LLM_MODEL_FAST, max_tokens=REPORT_MAX_TOKENS),
         verbose=True,
         memory=True
     )
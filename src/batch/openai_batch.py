@@ -0,0 +1,178 @@
+"""OpenAI Batch API client for non-latency-critical LLM calls."""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from ..config.settings import (
+    OPENAI_API_KEY, REQUESTS_TIMEOUT, BATCH_COMPLETION_WINDOW,
+    BATCH_POLL_INTERVAL, BATCH_MAX_WAIT
+)
+
+logger = logging.getLogger(__name__)
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _headers() -> Dict[str, str]:
+    """Authorization header for the OpenAI API."""
+    return {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+
+
+def build_chat_request(custom_id: str, model: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Build one line of a chat completions batch input file.
+
+    Args:
+        custom_id: Identifier used to map the response back to its request
+        model: Model name
+        messages: Chat messages
+
+    Returns:
+        Batch request dict
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_ENDPOINT,
+        "body": {"model": model, "messages": messages},
+    }
+
+
+def submit_batch(batch_requests: List[Dict[str, Any]]) -> Optional[str]:
+    """Upload batch requests as JSONL and create a batch.
+
+    Args:
+        batch_requests: Requests built with build_chat_request
+
+    Returns:
+        Batch ID, or None if submission failed
+    """
+    try:
+        payload = "\n".join(json.dumps(request) for request in batch_requests).encode()
+        upload = requests.post(
+            f"{OPENAI_API_BASE}/files",
+            headers=_headers(),
+            data={"purpose": "batch"},
+            files={"file": ("batch_input.jsonl", payload, "application/jsonl")},
+            timeout=REQUESTS_TIMEOUT
+        )
+        upload.raise_for_status()
+
+        response = requests.post(
+            f"{OPENAI_API_BASE}/batches",
+            headers=_headers(),
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": CHAT_COMPLETIONS_ENDPOINT,
+                "completion_window": BATCH_COMPLETION_WINDOW,
+            },
+            timeout=REQUESTS_TIMEOUT
+        )
+        response.raise_for_status()
+
+        batch_id = response.json()["id"]
+        logger.info(f"✅ Submitted batch {batch_id} with {len(batch_requests)} requests")
+        return batch_id
+    except Exception as e:
+        logger.error(f"❌ Error submitting batch: {e}")
+        return None
+
+
+def wait_for_batch(batch_id: str, poll_interval: int = BATCH_POLL_INTERVAL,
+                   max_wait: int = BATCH_MAX_WAIT) -> Optional[Dict[str, Any]]:
+    """Poll a batch until it reaches a terminal status.
+
+    Args:
+        batch_id: Batch ID from submit_batch
+        poll_interval: Seconds between status checks
+        max_wait: Give up after this many seconds
+
+    Returns:
+        Final batch object, or None on error or timeout
+    """
+    deadline = time.monotonic() + max_wait
+    while time.monotonic() < deadline:
+        try:
+            response = requests.get(
+                f"{OPENAI_API_BASE}/batches/{batch_id}",
+                headers=_headers(),
+                timeout=REQUESTS_TIMEOUT
+            )
+            response.raise_for_status()
+            batch = response.json()
+        except Exception as e:
+            logger.error(f"❌ Error polling batch {batch_id}: {e}")
+            return None
+
+        if batch.get("status") in TERMINAL_STATUSES:
+            logger.info(f"✅ Batch {batch_id} finished with status {batch['status']}")
+            return batch
+
+        time.sleep(poll_interval)
+
+    logger.error(f"❌ Batch {batch_id} did not finish within {max_wait}s")
+    return None
+
+
+def fetch_batch_results(batch: Dict[str, Any]) -> Dict[str, str]:
+    """Download a finished batch's output and map it by custom_id.
+
+    Args:
+        batch: Batch object returned by wait_for_batch
+
+    Returns:
+        Dict of custom_id -> assistant message content for successful requests
+    """
+    output_file_id = batch.get("output_file_id")
+    if not output_file_id:
+        logger.warning(f"⚠️  Batch {batch.get('id')} has no output file")
+        return {}
+
+    try:
+        response = requests.get(
+            f"{OPENAI_API_BASE}/files/{output_file_id}/content",
+            headers=_headers(),
+            timeout=REQUESTS_TIMEOUT
+        )
+        response.raise_for_status()
+
+        results = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                results[record["custom_id"]] = choices[0]["message"]["content"]
+            else:
+                logger.warning(f"⚠️  Batch request {record.get('custom_id')} failed: {record.get('error')}")
+        return results
+    except Exception as e:
+        logger.error(f"❌ Error fetching batch results: {e}")
+        return {}
+
+
+def run_batch(batch_requests: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Submit requests, wait for the batch to finish, and return its results.
+
+    Args:
+        batch_requests: Requests built with build_chat_request
+
+    Returns:
+        Dict of custom_id -> assistant message content
+    """
+    if not batch_requests:
+        return {}
+
+    batch_id = submit_batch(batch_requests)
+    if not batch_id:
+        return {}
+
+    batch = wait_for_batch(batch_id)
+    return fetch_batch_results(batch) if batch else {}
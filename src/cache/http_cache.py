@@ -0,0 +1,81 @@
+"""Persistent on-disk cache for search and fetch results."""
+
+import functools
+import hashlib
+import logging
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+from ..config.settings import HTTP_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache(cache_dir: Path = HTTP_CACHE_DIR):
+    """Lazily open the shared diskcache store.
+
+    Returns:
+        diskcache.Cache instance, or None if it cannot be opened
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    import diskcache
+
+                    _cache = diskcache.Cache(str(cache_dir))
+                except Exception as e:
+                    logger.warning(f"⚠️  HTTP cache unavailable: {e}")
+                    _cache = False
+    return _cache if _cache is not False else None
+
+
+def disk_cached(expire: int, daily: bool = False) -> Callable:
+    """Cache a function's non-empty results on disk, keyed by its arguments.
+
+    Only exact matches are served. Empty results (failed or rate-limited
+    calls) are never stored, so the next call retries the network.
+
+    Args:
+        expire: Entry TTL in seconds
+        daily: Include today's date in the key so results never outlive the day
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_http_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            raw_key = f"{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+            if daily:
+                raw_key = f"{raw_key}:{date.today().isoformat()}"
+            key = hashlib.sha256(raw_key.encode()).hexdigest()
+
+            try:
+                cached = cache.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️  HTTP cache read failed: {e}")
+                cached = None
+            if cached is not None:
+                logger.debug(f"✅ HTTP cache hit: {func.__name__}{args!r}")
+                return cached
+
+            result = func(*args, **kwargs)
+            if result:
+                try:
+                    cache.set(key, result, expire=expire)
+                except Exception as e:
+                    logger.warning(f"⚠️  HTTP cache write failed: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
+
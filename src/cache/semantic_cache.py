@@ -0,0 +1,109 @@
+"""Semantic response cache for per-startup agent outputs."""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Optional
+
+from ..config.settings import SEMANTIC_CACHE_DIR, SEMANTIC_CACHE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase and collapse whitespace for cache keys."""
+    return _WHITESPACE_RE.sub(' ', (text or '').lower()).strip()
+
+
+class SemanticCache:
+    """Cache agent responses keyed on startup name + description.
+
+    Lookups try an exact SHA-256 match on the normalized (name, description)
+    pair first, then fall back to embedding similarity on the description.
+    The name is always an exact-match requirement so two different startups
+    with similar pitches never share a cached analysis.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Path = SEMANTIC_CACHE_DIR):
+        """Initialize semantic cache.
+
+        Args:
+            namespace: Cache namespace, one per agent (e.g. "market_fit")
+            cache_dir: Directory for the persistent vector store
+        """
+        self.namespace = namespace
+        self.cache_dir = cache_dir
+        self._collection = None
+
+    @property
+    def collection(self):
+        """Lazily open the persistent ChromaDB collection."""
+        if self._collection is None:
+            import chromadb
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            client = chromadb.PersistentClient(path=str(self.cache_dir))
+            self._collection = client.get_or_create_collection(
+                name=f"{self.namespace}_responses",
+                metadata={"hnsw:space": "cosine"}
+            )
+        return self._collection
+
+    def _key_id(self, name: str, description: str) -> str:
+        """Exact-match key for a normalized (name, description) pair."""
+        key = f"{normalize_key(name)}\x1f{normalize_key(description)}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, name: str, description: str, threshold: float = SEMANTIC_CACHE_THRESHOLD) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            name: Startup name (must match exactly after normalization)
+            description: Startup description (matched semantically)
+            threshold: Minimum cosine similarity for a semantic hit
+
+        Returns:
+            Cached response, or None on miss
+        """
+        try:
+            exact = self.collection.get(ids=[self._key_id(name, description)], include=["metadatas"])
+            if exact["ids"]:
+                logger.debug(f"✅ Exact cache hit ({self.namespace}): {name}")
+                return exact["metadatas"][0]["response"]
+
+            if not description:
+                return None
+
+            similar = self.collection.query(
+                query_texts=[normalize_key(description)],
+                n_results=1,
+                where={"name": normalize_key(name)},
+                include=["metadatas", "distances"]
+            )
+            if similar["ids"][0] and 1 - similar["distances"][0][0] >= threshold:
+                logger.debug(f"✅ Semantic cache hit ({self.namespace}): {name}")
+                return similar["metadatas"][0][0]["response"]
+        except Exception as e:
+            logger.warning(f"⚠️  Semantic cache lookup failed: {e}")
+
+        return None
+
+    def put(self, name: str, description: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            name: Startup name
+            description: Startup description
+            response: Agent response to cache
+        """
+        try:
+            self.collection.upsert(
+                ids=[self._key_id(name, description)],
+                documents=[normalize_key(description) or normalize_key(name)],
+                metadatas=[{"name": normalize_key(name), "response": response}]
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Semantic cache write failed: {e}")
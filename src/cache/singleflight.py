@@ -0,0 +1,65 @@
+"""Coalesce concurrent identical calls across worker threads."""
+
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+SINGLEFLIGHT_CACHE_SIZE = 512
+
+
+def singleflight(key_func: Callable[..., Any], maxsize: int = SINGLEFLIGHT_CACHE_SIZE):
+    """Coalesce concurrent identical calls and memoize their results.
+
+    Agents run tools from worker threads, so the first caller for a key
+    performs the request while any concurrent caller with the same key waits
+    on its Future. Non-empty results are kept in a small LRU so later agents
+    reuse them; empty results (failed requests) are not cached.
+
+    Args:
+        key_func: Builds the coalescing key from the call arguments
+        maxsize: Maximum number of memoized results
+
+    Returns:
+        Decorator applying the coalescing to a function
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        in_flight: Dict[Any, Future] = {}
+        results: OrderedDict = OrderedDict()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = key_func(*args, **kwargs)
+            with lock:
+                if key in results:
+                    results.move_to_end(key)
+                    return results[key]
+                future = in_flight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = in_flight[key] = Future()
+
+            if not is_leader:
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    in_flight.pop(key, None)
+                future.set_exception(e)
+                raise
+
+            with lock:
+                in_flight.pop(key, None)
+                if result:
+                    results[key] = result
+                    if len(results) > maxsize:
+                        results.popitem(last=False)
+            future.set_result(result)
+            return result
+
+        return wrapper
+    return decorator
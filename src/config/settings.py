@@ -1,20 +1,36 @@
 """Configuration settings for the startup research agent."""
 
 import os
+import sys
 import logging
+import logging.handlers
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once per process tree
+if not os.getenv("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
-# Configure logging
+# Configure logging: records are buffered and written to stdout in batches
+# of LOG_BUFFER_CAPACITY; errors flush immediately
+LOG_BUFFER_CAPACITY = 8
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=_log_stream
+    )]
 )
 logger = logging.getLogger(__name__)
 
+
+def flush_logs() -> None:
+    """Write out any buffered log records."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
 # API Keys
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 GOOGLE_SEARCH_ENGINE_ID = os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
@@ -27,18 +43,20 @@ EMAIL_RECIPIENTS = os.getenv("EMAIL_RECIPIENTS", "").split(",") if os.getenv("EM
 ENABLE_EMAIL_NOTIFICATIONS = os.getenv("ENABLE_EMAIL_NOTIFICATIONS", "false").lower() == "true"
 
 # LLM Configuration (OpenAI Models)
-# Using gpt-4o for both - supports JSON schema structured outputs
-# gpt-4o is cheaper than gpt-4 and faster than gpt-3.5-turbo
-LLM_MODEL_FAST = "gpt-4o"  # Fast, supports JSON schema
+# Both models support JSON schema structured outputs
+# gpt-4o-mini handles report synthesis, the lowest-reasoning step, at a fraction of the cost
+LLM_MODEL_FAST = "gpt-4o-mini"  # Fast, supports JSON schema
 LLM_MODEL_SMART = "gpt-4o"  # Supports JSON schema for structured outputs
+REPORT_MAX_TOKENS = 512  # Output cap for the report agent
 
 # City Tiers
-TIER_1_CITIES = ["Delhi", "Mumbai", "Bangalore"]
-TIER_2_CITIES = ["Pune", "Hyderabad", "Chennai"]
-TIER_3_CITIES = ["Jaipur", "Lucknow", "Chandigarh", "Ahmedabad", "Kolkata"]
+TIER_1_CITIES = frozenset({"Delhi", "Mumbai", "Bangalore"})
+TIER_2_CITIES = frozenset({"Pune", "Hyderabad", "Chennai"})
+TIER_3_CITIES = frozenset({"Jaipur", "Lucknow", "Chandigarh", "Ahmedabad", "Kolkata"})
 
 # Search Configuration
 SEARCH_RESULTS_PER_QUERY = 10
+SEARCH_CONCURRENCY = 10  # queries in flight at once in search_recent_startups
 MAX_STARTUPS_PER_RUN = 100
 MIN_INDIA_FIT_SCORE = 40
 
@@ -46,13 +64,22 @@ MIN_INDIA_FIT_SCORE = 40
 GOOGLE_SEARCH_RATE_LIMIT = 100  # per day
 REQUESTS_TIMEOUT = 30  # seconds
 
-# Database
-DB_PATH = Path(__file__).parent.parent.parent / "startup_research.db"
+# Database (override with the DB_PATH env var, e.g. ":memory:" for tests)
+DB_PATH = Path(os.getenv("DB_PATH") or Path(__file__).parent.parent.parent / "startup_research.db")
 
 # Output
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "reports"
 REPORT_FORMAT = "json"  # json or pdf
 
+# Semantic cache for per-startup agent responses
+SEMANTIC_CACHE_DIR = Path(__file__).parent.parent.parent / "cache" / "semantic"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity for a cache hit
+
+# On-disk cache for search API responses and fetched page text
+HTTP_CACHE_DIR = Path(__file__).parent.parent.parent / "cache" / "http"
+SEARCH_CACHE_TTL = 24 * 60 * 60  # seconds
+URL_CACHE_TTL = 60 * 60  # seconds
+
 # Logging
 LOG_LEVEL = "INFO"
 LOG_FILE = Path(__file__).parent.parent.parent / "logs" / "startup_research.log"
@@ -62,6 +89,12 @@ AGENT_TIMEOUT = 300  # seconds
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 API_RATE_LIMIT_DELAY = 2  # seconds between OpenAI API calls to avoid 429 errors
+MAX_CONCURRENT_AGENT_CALLS = 16  # in-flight per-startup analyses, bounded for OpenAI rate limits
+
+# OpenAI Batch API (used with --batch for scheduled, non-latency-critical runs)
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30  # seconds
+BATCH_MAX_WAIT = 24 * 60 * 60  # seconds
 
 # Deduplication
 DEDUPLICATION_THRESHOLD = 0.85  # Fuzzy match threshold
@@ -1,138 +1,108 @@
 """CrewAI crew orchestration for startup research."""
 
+import asyncio
 import json
 import logging
-import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
 from crewai import Crew, Process
 from .tasks.crew_tasks import create_all_tasks
-from .database.db import init_database, insert_startup, insert_run_metadata, get_all_startups
+from .database.db import (
+    init_database, insert_startups_bulk, insert_run_metadata, get_tier_counts
+)
+from .cache.semantic_cache import SemanticCache
+from .batch.openai_batch import build_chat_request, run_batch
 from .utils.agent_tracker import AgentTracker
+from .utils.agent_output import analysis_record, merge_results, parse_agent_json
 from .tools.email_tools import send_startup_report_email
-from .config.settings import ENABLE_EMAIL_NOTIFICATIONS, EMAIL_RECIPIENTS
+from .config.settings import (
+    ENABLE_EMAIL_NOTIFICATIONS, EMAIL_RECIPIENTS, MAX_CONCURRENT_AGENT_CALLS, LLM_MODEL_SMART,
+    flush_logs
+)
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+
 
 class StartupResearchCrew:
     """Main crew for startup research."""
 
-    def __init__(self):
-        """Initialize the crew."""
+    def __init__(self, use_batch: bool = False):
+        """Initialize the crew.
+
+        Args:
+            use_batch: Run per-startup analyses through the OpenAI Batch API
+                (cheaper, but results can take hours) instead of in-process
+        """
+        self.use_batch = use_batch
         self.tasks, self.agents = create_all_tasks()
-        self.crew = None
+        self.discovery_crew = None
+        self.market_fit_crew = None
+        self.tier_crew = None
+        self.report_crew = None
+        self.market_fit_cache = SemanticCache("market_fit")
+        self.tier_cache = SemanticCache("tier")
         self.run_id = None
         self.tracker = None
         self.start_time = None
+        self.summary = {'total': 0, 'tier_counts': {}}
+        self._bg_executor: Optional[ThreadPoolExecutor] = None
+        self._bg_tasks: List[Future] = []
 
     def setup_crew(self):
-        """Setup the crew with all agents and tasks."""
-        self.crew = Crew(
-            agents=self.agents,
-            tasks=self.tasks,
+        """Setup one crew per pipeline stage.
+
+        Discovery and reporting run once; market fit and tier categorization
+        are independent per startup, so their crews are copied and kicked off
+        concurrently for each discovered startup.
+        """
+        discovery_task, market_fit_task, tier_task, report_task = self.tasks
+        discovery_agent, market_fit_agent, tier_agent, report_agent = self.agents
+
+        self.discovery_crew = self._build_crew(discovery_agent, discovery_task)
+        self.market_fit_crew = self._build_crew(market_fit_agent, market_fit_task)
+        self.tier_crew = self._build_crew(tier_agent, tier_task)
+        self.report_crew = self._build_crew(report_agent, report_task)
+        logger.info("✅ Crew setup complete")
+
+    @staticmethod
+    def _build_crew(agent, task) -> Crew:
+        """Build a single-stage crew."""
+        return Crew(
+            agents=[agent],
+            tasks=[task],
             process=Process.sequential,
             verbose=True,
             memory=True,
             cache=True
         )
-        print("✅ Crew setup complete")
 
     def generate_run_id(self) -> str:
         """Generate unique run ID."""
         return f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    def parse_startup_data(self, text: str) -> list:
-        """Parse startup data from agent output."""
-        startups = []
-        try:
-            # Try to parse as JSON first
-            if text.strip().startswith('[') or text.strip().startswith('{'):
-                data = json.loads(text)
-                if isinstance(data, list):
-                    startups = data
-                elif isinstance(data, dict):
-                    # Check for various possible keys
-                    if 'startups' in data:
-                        startups = data['startups']
-                    elif 'top_opportunities' in data:
-                        startups = data['top_opportunities']
-                    elif 'opportunities' in data:
-                        startups = data['opportunities']
-                    else:
-                        # If it's a dict with startup-like data, wrap it
-                        if 'name' in data:
-                            startups = [data]
-            else:
-                # Try to extract JSON from text
-                json_match = re.search(r'\[.*\]|\{.*\}', text, re.DOTALL)
-                if json_match:
-                    startups = json.loads(json_match.group())
-                    if isinstance(startups, dict) and 'startups' in startups:
-                        startups = startups['startups']
-                    elif isinstance(startups, dict) and 'top_opportunities' in startups:
-                        startups = startups['top_opportunities']
-                    elif isinstance(startups, dict):
-                        startups = [startups]
-        except json.JSONDecodeError:
-            logger.warning("Could not parse JSON from agent output")
-
-        return startups if isinstance(startups, list) else []
-
-    def extract_tier_info(self, text: str) -> dict:
-        """Extract tier information from agent output."""
-        tier_info = {}
-        try:
-            if text.strip().startswith('[') or text.strip().startswith('{'):
-                data = json.loads(text)
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            name = item.get('name') or item.get('startup_name')
-                            tier_info[name] = {
-                                'primary_tier': item.get('primary_tier') or item.get('tier'),
-                                'secondary_tiers': item.get('secondary_tiers') or item.get('secondary_tier'),
-                                'reasoning': item.get('reasoning') or item.get('reason')
-                            }
-                elif isinstance(data, dict):
-                    for key, value in data.items():
-                        if isinstance(value, dict):
-                            tier_info[key] = value
-        except json.JSONDecodeError:
-            logger.warning("Could not parse tier data from agent output")
-
-        return tier_info
-
-    def extract_market_fit(self, text: str) -> dict:
-        """Extract market fit scores from agent output."""
-        fit_info = {}
-        try:
-            if text.strip().startswith('[') or text.strip().startswith('{'):
-                data = json.loads(text)
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            name = item.get('name') or item.get('startup_name')
-                            fit_info[name] = {
-                                'score': item.get('india_fit_score') or item.get('score'),
-                                'analysis': item.get('india_fit_analysis') or item.get('analysis')
-                            }
-                elif isinstance(data, dict):
-                    for key, value in data.items():
-                        if isinstance(value, dict):
-                            fit_info[key] = value
-        except json.JSONDecodeError:
-            logger.warning("Could not parse market fit data from agent output")
-
-        return fit_info
+    def parse_startup_data(self, output: Union[str, Any]) -> list:
+        """Parse startup data from agent output text or an already-parsed object."""
+        return parse_agent_json(output)['startups']
+
+    def extract_tier_info(self, output: Union[str, Any]) -> dict:
+        """Extract tier information from agent output text or an already-parsed object."""
+        return parse_agent_json(output)['tiers']
+
+    def extract_market_fit(self, output: Union[str, Any]) -> dict:
+        """Extract market fit scores from agent output text or an already-parsed object."""
+        return parse_agent_json(output)['fits']
 
     def run(self) -> dict:
         """Run the crew."""
         try:
             self.start_time = datetime.now()
-            print("\n" + "="*60)
-            print("🚀 Starting Startup Research Agent System")
-            print("="*60 + "\n")
+            logger.info(_BANNER)
+            logger.info("🚀 Starting Startup Research Agent System")
+            logger.info(_BANNER)
 
             # Initialize database
             init_database()
@@ -142,135 +112,281 @@ class StartupResearchCrew:
 
             # Generate run ID
             self.run_id = self.generate_run_id()
-            print(f"📊 Run ID: {self.run_id}\n")
+            logger.info(f"📊 Run ID: {self.run_id}")
 
             # Initialize tracker
             self.tracker = AgentTracker(self.run_id)
 
             # Execute crew
-            print("⏳ Executing crew tasks...\n")
-
-            # Log agent start
-            for agent in self.agents:
-                self.tracker.start_agent(
-                    agent.role,
-                    f"Executing {agent.role}",
-                    {'role': agent.role, 'goal': agent.goal}
-                )
-
-            result = self.crew.kickoff()
-
-            # Log agent completion
-            for agent in self.agents:
-                self.tracker.end_agent(agent.role, str(result)[:500], 'completed')
+            logger.info("⏳ Executing crew tasks...")
+            startups, result = asyncio.run(self._run_async())
 
             # Process results
-            print("\n" + "="*60)
-            print("✅ Crew execution completed")
-            print("="*60 + "\n")
+            logger.info(_BANNER)
+            logger.info("✅ Crew execution completed")
+            logger.info(_BANNER)
 
-            # Extract and save results
-            self._process_and_save_results(result)
+            # Save results
+            self.summary = self._process_and_save_results(startups)
 
-            # Save reports
-            self.tracker.save_all_reports()
-
-            # Send email notification if enabled
-            self._send_email_notification()
+            # Save reports and send the email off the critical path;
+            # the email attaches the saved reports, so they run in order
+            self._submit_background(self._finalize_run)
 
+            flush_logs()
             return {
                 'success': True,
                 'run_id': self.run_id,
                 'result': str(result),
+                'summary': self.summary,
                 'timestamp': datetime.now().isoformat()
             }
 
         except Exception as e:
             logger.error(f"❌ Error running crew: {e}", exc_info=True)
-            print(f"\n❌ Error running crew: {e}")
             return {
                 'success': False,
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
 
-    def _process_and_save_results(self, result):
-        """Process crew results and save to database."""
+    def _finalize_run(self) -> None:
+        """Save agent reports, then send the email notification if enabled."""
         try:
-            result_str = str(result)
+            self.tracker.save_all_reports()
+            self._send_email_notification()
+        except Exception as e:
+            logger.error(f"❌ Error finalizing run: {e}", exc_info=True)
+
+    def _submit_background(self, func) -> None:
+        """Run func on the background worker, started on first use."""
+        if self._bg_executor is None:
+            self._bg_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-io")
+        self._bg_tasks.append(self._bg_executor.submit(func))
+
+    def wait_for_background(self) -> None:
+        """Block until report saving and email delivery have finished.
+
+        Failures in background work are logged, and the worker thread is
+        shut down (a later run starts a new one).
+        """
+        for future in self._bg_tasks:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"❌ Background task failed: {e}", exc_info=True)
+        self._bg_tasks.clear()
+        if self._bg_executor is not None:
+            self._bg_executor.shutdown(wait=True)
+            self._bg_executor = None
+        flush_logs()
+
+    async def _run_async(self):
+        """Run discovery, fan out per-startup analyses, then report.
+
+        Returns:
+            Tuple of (merged startup records, report crew output)
+        """
+        discovery_agent, market_fit_agent, tier_agent, report_agent = self.agents
+
+        # Discovery
+        self._start_stage(discovery_agent)
+        discovery = await self.discovery_crew.kickoff_async()
+        self.tracker.end_agent(discovery_agent.role, str(discovery)[:500], 'completed')
+
+        startups = parse_agent_json(str(discovery))['startups']
+
+        self._start_stage(market_fit_agent)
+        self._start_stage(tier_agent)
+        if self.use_batch:
+            logger.info(f"📊 Discovered {len(startups)} startups, analyzing via Batch API")
+            fit_outputs, tier_outputs = await asyncio.to_thread(self._analyze_batch, startups)
+        else:
+            logger.info(f"📊 Discovered {len(startups)} startups, analyzing concurrently")
+            fit_outputs, tier_outputs = await self._analyze_concurrently(startups)
+        fit_done = sum(output is not None for output in fit_outputs)
+        tier_done = sum(output is not None for output in tier_outputs)
+        self.tracker.end_agent(market_fit_agent.role, f"{fit_done}/{len(startups)} analyses", 'completed')
+        self.tracker.end_agent(tier_agent.role, f"{tier_done}/{len(startups)} analyses", 'completed')
+
+        merged = merge_results(startups, fit_outputs, tier_outputs)
+
+        # Report
+        self._start_stage(report_agent)
+        report = await self.report_crew.kickoff_async(inputs={'startups': json.dumps(merged, default=str)})
+        self.tracker.end_agent(report_agent.role, str(report)[:500], 'completed')
+
+        return merged, report
+
+    @staticmethod
+    def _cache_key(startup: dict) -> Tuple[str, str]:
+        """(name, description) pair used to key the response caches."""
+        name = startup.get('name') or startup.get('startup_name') or ''
+        return name, startup.get('description') or ''
+
+    async def _analyze_concurrently(
+        self, startups: List[dict]
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Run market fit and tier crews per startup in-process.
+
+        Returns:
+            Tuple of (market fit outputs, tier outputs), index-aligned with
+            startups; None where an analysis failed
+        """
+        # Market fit and tier categorization are independent per startup
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENT_CALLS)
+
+        async def analyze(crew: Crew, cache: SemanticCache, kind: str, startup: dict) -> str:
+            name, description = self._cache_key(startup)
+
+            # Startups re-appearing across runs are answered from the cache;
+            # ChromaDB lookups embed text, so keep them off the event loop
+            cached = await asyncio.to_thread(cache.get, name, description)
+            if cached is not None:
+                return cached
+
+            async with semaphore:
+                output = str(await crew.copy().kickoff_async(inputs={'startup': json.dumps(startup)}))
+
+            # Only cache answers that actually carry this startup's analysis,
+            # so an unparseable reply is retried next run instead of replayed
+            if analysis_record(output, kind, name) is not None:
+                await asyncio.to_thread(cache.put, name, description, output)
+            return output
+
+        analyses = await asyncio.gather(
+            *[analyze(self.market_fit_crew, self.market_fit_cache, 'fits', startup) for startup in startups],
+            *[analyze(self.tier_crew, self.tier_cache, 'tiers', startup) for startup in startups],
+            return_exceptions=True
+        )
+        return (
+            self._aligned_outputs(analyses[:len(startups)]),
+            self._aligned_outputs(analyses[len(startups):])
+        )
 
-            # Debug: Print first 500 chars of result
-            logger.info(f"📊 Crew result (first 500 chars): {result_str[:500]}")
+    def _analyze_batch(self, startups: List[dict]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Run market fit and tier analyses as one OpenAI batch.
+
+        Prompts are built from each crew's agent and task. Batch requests
+        are plain chat completions, so the agents' search tools are not
+        available in this mode.
+
+        Returns:
+            Tuple of (market fit outputs, tier outputs), index-aligned with
+            startups; None where no result came back
+        """
+        jobs = {
+            'market_fit': (self.market_fit_crew, self.market_fit_cache, 'fits'),
+            'tier': (self.tier_crew, self.tier_cache, 'tiers'),
+        }
+        outputs = {kind: [None] * len(startups) for kind in jobs}
+        batch_requests = []
+        pending = {}
+
+        for kind, (crew, cache, record_kind) in jobs.items():
+            agent, task = crew.agents[0], crew.tasks[0]
+            for index, startup in enumerate(startups):
+                name, description = self._cache_key(startup)
+                cached = cache.get(name, description)
+                if cached is not None:
+                    outputs[kind][index] = cached
+                    continue
 
-            # Parse startups from discovery agent output
-            startups = self.parse_startup_data(result_str)
+                custom_id = f"{kind}-{index}"
+                pending[custom_id] = (kind, index, cache, record_kind, name, description)
+                batch_requests.append(
+                    build_chat_request(custom_id, LLM_MODEL_SMART, self._batch_messages(agent, task, startup))
+                )
 
+        results = run_batch(batch_requests)
+        for custom_id, (kind, index, cache, record_kind, name, description) in pending.items():
+            content = results.get(custom_id)
+            if content is None:
+                logger.warning(f"⚠️  No batch result for {custom_id} ({name})")
+                continue
+            # Only cache answers that actually carry this startup's analysis
+            if analysis_record(content, record_kind, name) is not None:
+                cache.put(name, description, content)
+            outputs[kind][index] = content
+
+        return outputs['market_fit'], outputs['tier']
+
+    @staticmethod
+    def _batch_messages(agent, task, startup: dict) -> List[dict]:
+        """Chat messages equivalent to running task on agent for one startup."""
+        system = f"You are {agent.role}. {agent.backstory}\n\nYour goal: {agent.goal}"
+        user = (
+            task.description.replace('{startup}', json.dumps(startup))
+            + f"\n\nExpected output:\n{task.expected_output}"
+        )
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
+
+    def _start_stage(self, agent) -> None:
+        """Record the start of an agent's pipeline stage."""
+        self.tracker.start_agent(
+            agent.role,
+            f"Executing {agent.role}",
+            {'role': agent.role, 'goal': agent.goal}
+        )
+
+    @staticmethod
+    def _aligned_outputs(results: list) -> List[Optional[str]]:
+        """Replace failed per-startup analyses with None, keeping positions.
+
+        One bad call doesn't sink the run, and output i still belongs to
+        startup i.
+        """
+        outputs = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"⚠️  Startup analysis failed: {result}")
+                outputs.append(None)
+            else:
+                outputs.append(result)
+        return outputs
+
+    def _process_and_save_results(self, startups: List[dict]) -> dict:
+        """Save merged startup records and run metadata to database.
+
+        Returns:
+            Summary dict with the total startup count and per-tier counts
+        """
+        summary = {'total': 0, 'tier_counts': {}}
+        try:
             # Debug: Print parsed startups
             if startups:
-                logger.info(f"📊 Parsed startups: {json.dumps(startups[:2], indent=2)}")
+                logger.info(f"📊 Parsed startups: {json.dumps(startups[:2], indent=2, default=str)}")
 
             logger.info(f"📊 Found {len(startups)} startups to process")
 
-            # Extract tier and market fit info
-            tier_info = self.extract_tier_info(result_str)
-            fit_info = self.extract_market_fit(result_str)
-
             # Insert startups into database
-            inserted_count = 0
-            for startup in startups:
-                if not isinstance(startup, dict):
-                    continue
-
-                name = startup.get('name') or startup.get('startup_name')
-                if not name:
-                    continue
-
-                # Merge tier and fit info
-                startup_data = {
-                    'name': name,
-                    'website': startup.get('website') or startup.get('url'),
-                    'description': startup.get('description'),
-                    'category': startup.get('category'),
-                    'founded_date': startup.get('founded_date') or startup.get('date'),
-                    'country': startup.get('country'),
-                    'source': startup.get('source'),
-                    'source_url': startup.get('source_url'),
-                    'hash': hash(name)
-                }
-
-                # Add tier info - check both extracted tier_info and startup dict
-                if name in tier_info:
-                    startup_data['primary_tier'] = tier_info[name].get('primary_tier')
-                    startup_data['secondary_tiers'] = tier_info[name].get('secondary_tiers')
-                elif 'primary_tier' in startup:
-                    startup_data['primary_tier'] = startup.get('primary_tier')
-                    startup_data['secondary_tiers'] = startup.get('secondary_tiers')
-
-                # Add market fit info - check both extracted fit_info and startup dict
-                if name in fit_info:
-                    startup_data['india_fit_score'] = fit_info[name].get('score', 0)
-                    startup_data['india_fit_analysis'] = fit_info[name].get('analysis')
-                elif 'india_fit_score' in startup:
-                    startup_data['india_fit_score'] = startup.get('india_fit_score', 0)
-                    startup_data['india_fit_analysis'] = startup.get('india_fit_analysis')
-
-                # Insert into database
-                if insert_startup(startup_data):
-                    inserted_count += 1
+            inserted_count = insert_startups_bulk(startups)
 
             logger.info(f"✅ Inserted {inserted_count} startups into database")
 
             # Get final counts
-            all_startups = get_all_startups()
-            tier_1_count = len([s for s in all_startups if s.get('primary_tier') == 'Tier 1'])
-            tier_2_count = len([s for s in all_startups if s.get('primary_tier') == 'Tier 2'])
-            tier_3_count = len([s for s in all_startups if s.get('primary_tier') == 'Tier 3'])
+            tier_counts = get_tier_counts()
+            total_startups = sum(tier_counts.values())
+            tier_1_count = tier_counts.get('Tier 1', 0)
+            tier_2_count = tier_counts.get('Tier 2', 0)
+            tier_3_count = tier_counts.get('Tier 3', 0)
+            summary = {
+                'total': total_startups,
+                'tier_counts': {
+                    'Tier 1': tier_1_count,
+                    'Tier 2': tier_2_count,
+                    'Tier 3': tier_3_count,
+                }
+            }
 
             # Save run metadata
             processing_time = (datetime.now() - self.start_time).total_seconds()
             run_data = {
                 'run_id': self.run_id,
-                'total_startups_found': len(all_startups),
+                'total_startups_found': total_startups,
                 'tier_1_count': tier_1_count,
                 'tier_2_count': tier_2_count,
                 'tier_3_count': tier_3_count,
@@ -281,44 +397,36 @@ class StartupResearchCrew:
 
             insert_run_metadata(run_data)
 
-            print(f"\n📊 Summary:")
-            print(f"   Total startups: {len(all_startups)}")
-            print(f"   Tier 1: {tier_1_count}")
-            print(f"   Tier 2: {tier_2_count}")
-            print(f"   Tier 3: {tier_3_count}")
-            print(f"   Processing time: {processing_time:.2f}s")
-            print(f"   Reports saved to: {self.tracker.output_dir}\n")
+            logger.info(
+                f"📊 Summary: {total_startups} startups "
+                f"(Tier 1: {tier_1_count}, Tier 2: {tier_2_count}, Tier 3: {tier_3_count}) "
+                f"in {processing_time:.2f}s; reports saved to {self.tracker.output_dir}"
+            )
 
         except Exception as e:
             logger.error(f"❌ Error processing results: {e}", exc_info=True)
 
+        return summary
+
     def _send_email_notification(self) -> None:
         """Send email notification with report."""
         if not ENABLE_EMAIL_NOTIFICATIONS or not EMAIL_RECIPIENTS:
             return
 
         try:
-            # Get startup counts by tier
-            all_startups = get_all_startups()
-            tier_breakdown = {
-                'Tier 1': len([s for s in all_startups if s.get('primary_tier') == 'Tier 1']),
-                'Tier 2': len([s for s in all_startups if s.get('primary_tier') == 'Tier 2']),
-                'Tier 3': len([s for s in all_startups if s.get('primary_tier') == 'Tier 3']),
-            }
-
-            # Send email
+            # Startup counts were computed when results were saved
             success = send_startup_report_email(
                 recipient_emails=EMAIL_RECIPIENTS,
                 run_id=self.run_id,
                 report_dir=self.tracker.output_dir,
-                startup_count=len(all_startups),
-                tier_breakdown=tier_breakdown,
+                startup_count=self.summary['total'],
+                tier_breakdown=self.summary['tier_counts'],
             )
 
             if success:
-                print("📧 Email notification sent successfully")
+                logger.info("📧 Email notification sent successfully")
             else:
-                print("⚠️  Email notification failed - check configuration")
+                logger.warning("⚠️  Email notification failed - check configuration")
 
         except Exception as e:
             logger.error(f"❌ Error sending email notification: {e}")
@@ -329,12 +437,13 @@ def main():
     crew = StartupResearchCrew()
     result = crew.run()
     
-    print("\n" + "="*60)
+    print("\n" + _BANNER)
     print("📋 EXECUTION SUMMARY")
-    print("="*60)
+    print(_BANNER)
     print(json.dumps(result, indent=2))
-    print("="*60 + "\n")
+    print(_BANNER + "\n")
     
+    crew.wait_for_background()
     return result
 
 
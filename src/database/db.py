@@ -1,27 +1,154 @@
 """SQLite database setup and management."""
 
 import sqlite3
+import hashlib
 import json
 import logging
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Generator
+from typing import Optional, List, Dict, Any, Generator, Iterator
 
 from ..config.settings import DB_PATH
 
 logger = logging.getLogger(__name__)
 
+# str.translate table deleting every ASCII character that is not [a-z0-9]
+_ASCII_NON_ALNUM = dict.fromkeys(i for i in range(128) if not chr(i).isalnum())
+
+
+def normalize_startup_name(name: str) -> str:
+    """Casefold a startup name and drop punctuation/whitespace ("Acme, Inc." -> "acmeinc").
+
+    ASCII names (the common case) are returned as is when already clean and
+    otherwise stripped in a single str.translate pass. Non-ASCII names keep
+    their Unicode letters and digits ("字节跳动" stays "字节跳动"). A name with
+    no letters or digits at all (e.g. an emoji) falls back to its casefolded
+    text, so distinct names never collapse into the same empty key.
+    """
+    folded = (name or '').casefold()
+    if folded.isascii():
+        normalized = folded if folded.isalnum() else folded.translate(_ASCII_NON_ALNUM)
+    else:
+        normalized = ''.join(ch for ch in folded if ch.isalnum())
+    return normalized or folded.strip()
+
+
+def startup_name_hash(name: str) -> str:
+    """Stable dedup hash for a startup name, identical across processes.
+
+    Unlike the built-in hash(), blake2b is not salted per interpreter run,
+    so the UNIQUE hash column keeps deduplicating across runs. Rows from
+    databases that stored hash() values are rehashed by init_database().
+    """
+    return hashlib.blake2b(normalize_startup_name(name).encode(), digest_size=16).hexdigest()
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Tune SQLite for this single-writer workload.
+
+    WAL is persisted in the database file, so re-applying it is a no-op;
+    the remaining pragmas are per-connection.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+
+
+STATEMENT_CACHE_SIZE = 200
+
+_connection: Optional[sqlite3.Connection] = None
+_connection_lock = threading.RLock()
+
 
 @contextmanager
 def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Context manager for database connections."""
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    """Context manager yielding the shared database connection.
+
+    A single connection is reused for the life of the process so SQLite's
+    prepared statement cache survives between calls. Access is serialized
+    with a lock, and any transaction the caller did not commit is rolled
+    back on exit so it cannot leak into the next caller's commit.
+    """
+    global _connection
+    with _connection_lock:
+        if _connection is None:
+            _connection = sqlite3.connect(
+                str(DB_PATH),
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            _connection.row_factory = sqlite3.Row
+            _apply_pragmas(_connection)
+        conn = _connection
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+
+def close_db_connection() -> None:
+    """Close the shared database connection (reopened on next use)."""
+    global _connection
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+def _create_fts_index(cursor: sqlite3.Cursor) -> None:
+    """Create the trigram FTS5 index over startup name/category.
+
+    The trigram tokenizer matches arbitrary substrings, so a category
+    search for "tech" still finds "FinTech" and "EdTech". Tables built
+    with the earlier word tokenizer are dropped and rebuilt. If this
+    SQLite build lacks FTS5 or trigram support, no index is created and
+    category lookups fall back to LIKE.
+    """
+    existing = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'startups_fts'"
+    ).fetchone()
+    if existing and 'trigram' in existing[0]:
+        return
+    if existing:
+        cursor.executescript("""
+            DROP TRIGGER IF EXISTS startups_fts_ai;
+            DROP TRIGGER IF EXISTS startups_fts_ad;
+            DROP TRIGGER IF EXISTS startups_fts_au;
+            DROP TABLE startups_fts;
+        """)
+
     try:
-        yield conn
-    finally:
-        conn.close()
+        cursor.executescript("""
+            CREATE VIRTUAL TABLE startups_fts
+            USING fts5(name, category, content='startups', content_rowid='id',
+                       tokenize='trigram');
+
+            CREATE TRIGGER IF NOT EXISTS startups_fts_ai AFTER INSERT ON startups BEGIN
+                INSERT INTO startups_fts(rowid, name, category)
+                VALUES (new.id, new.name, new.category);
+            END;
+            CREATE TRIGGER IF NOT EXISTS startups_fts_ad AFTER DELETE ON startups BEGIN
+                INSERT INTO startups_fts(startups_fts, rowid, name, category)
+                VALUES ('delete', old.id, old.name, old.category);
+            END;
+            CREATE TRIGGER IF NOT EXISTS startups_fts_au AFTER UPDATE ON startups BEGIN
+                INSERT INTO startups_fts(startups_fts, rowid, name, category)
+                VALUES ('delete', old.id, old.name, old.category);
+                INSERT INTO startups_fts(rowid, name, category)
+                VALUES (new.id, new.name, new.category);
+            END;
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"⚠️  Full-text index unavailable, using LIKE for category search: {e}")
+        return
+
+    # Index rows written before the FTS table existed
+    cursor.execute("INSERT INTO startups_fts(startups_fts) VALUES ('rebuild')")
 
 
 def init_database() -> None:
@@ -29,6 +156,7 @@ def init_database() -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
 
             # Create startups table
             cursor.execute("""
@@ -52,6 +180,45 @@ def init_database() -> None:
                 )
             """)
 
+            # Rehash rows written before every insert stored a blake2b name
+            # hash: NULLs, and the salted built-in hash() integers older runs
+            # wrote, which never match a new row's hash. Without this the
+            # UNIQUE(hash) constraint cannot deduplicate against them.
+            legacy = cursor.execute("""
+                SELECT id, name FROM startups
+                WHERE hash IS NULL OR length(hash) != 32 OR hash GLOB '*[^0-9a-f]*'
+            """).fetchall()
+            if legacy:
+                cursor.executemany(
+                    "UPDATE OR IGNORE startups SET hash = ? WHERE id = ?",
+                    [(startup_name_hash(row['name']), row['id']) for row in legacy]
+                )
+                # Rows whose hash would collide keep their old value and are
+                # re-selected on every init, so only report rows actually updated
+                if cursor.rowcount > 0:
+                    logger.info(f"✅ Backfilled hashes for {cursor.rowcount} startups")
+
+            # Index backing tier lookups, pre-sorted by India fit score
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_startups_tier_score
+                ON startups(primary_tier, india_fit_score DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_startups_created
+                ON startups(created_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_startups_fit
+                ON startups(india_fit_score DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_startups_category
+                ON startups(category)
+            """)
+
+            # Full-text index over name/category, kept in sync by triggers
+            _create_fts_index(cursor)
+
             # Create run_metadata table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS run_metadata (
@@ -69,6 +236,12 @@ def init_database() -> None:
                 )
             """)
 
+            # Index backing get_latest_run's ORDER BY run_date DESC LIMIT 1
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_run_metadata_run_date
+                ON run_metadata(run_date DESC)
+            """)
+
             # Create knowledge_base table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS knowledge_base (
@@ -89,78 +262,162 @@ def init_database() -> None:
 
 
 def insert_startup(startup_data: Dict[str, Any]) -> bool:
-    """Insert a startup into the database."""
+    """Insert a startup into the database.
+
+    Thin wrapper over insert_startups_bulk, so single and batch inserts
+    share one code path.
+
+    Returns:
+        True if the row was inserted, False if it was a duplicate or failed
+    """
+    if insert_startups_bulk([startup_data]) == 1:
+        logger.debug(f"✅ Inserted startup: {startup_data.get('name')}")
+        return True
+    logger.warning(f"⚠️  Startup not inserted (duplicate?): {startup_data.get('name')}")
+    return False
+
+
+def insert_startups_bulk(startups: List[Dict[str, Any]]) -> int:
+    """Insert many startups in a single transaction.
+
+    Duplicates (by name or hash) are skipped via INSERT OR IGNORE, so no
+    per-row IntegrityError is raised. Rows without a hash get one derived
+    from the normalized name.
+
+    Returns:
+        Number of rows actually inserted
+    """
+    if not startups:
+        return 0
+
+    rows = []
+    for startup_data in startups:
+        # Convert secondary_tiers list to JSON string if needed
+        secondary_tiers = startup_data.get('secondary_tiers')
+        if isinstance(secondary_tiers, list):
+            secondary_tiers = json.dumps(secondary_tiers)
+
+        rows.append((
+            startup_data.get('name'),
+            startup_data.get('website'),
+            startup_data.get('description'),
+            startup_data.get('category'),
+            startup_data.get('founded_date'),
+            startup_data.get('country'),
+            startup_data.get('india_fit_score', 0),
+            startup_data.get('india_fit_analysis'),
+            startup_data.get('primary_tier'),
+            secondary_tiers,
+            startup_data.get('source'),
+            startup_data.get('source_url'),
+            startup_data.get('hash') or startup_name_hash(startup_data.get('name'))
+        ))
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-
-            # Convert secondary_tiers list to JSON string if needed
-            secondary_tiers = startup_data.get('secondary_tiers')
-            if isinstance(secondary_tiers, list):
-                secondary_tiers = json.dumps(secondary_tiers)
-
-            cursor.execute("""
-                INSERT INTO startups (
+            cursor.execute("BEGIN")
+            cursor.executemany("""
+                INSERT OR IGNORE INTO startups (
                     name, website, description, category, founded_date,
                     country, india_fit_score, india_fit_analysis,
                     primary_tier, secondary_tiers, source, source_url, hash
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                startup_data.get('name'),
-                startup_data.get('website'),
-                startup_data.get('description'),
-                startup_data.get('category'),
-                startup_data.get('founded_date'),
-                startup_data.get('country'),
-                startup_data.get('india_fit_score', 0),
-                startup_data.get('india_fit_analysis'),
-                startup_data.get('primary_tier'),
-                secondary_tiers,
-                startup_data.get('source'),
-                startup_data.get('source_url'),
-                startup_data.get('hash')
-            ))
+            """, rows)
+            inserted = cursor.rowcount
 
             conn.commit()
-            logger.debug(f"✅ Inserted startup: {startup_data.get('name')}")
-            return True
-    except sqlite3.IntegrityError:
-        logger.warning(f"⚠️  Duplicate startup: {startup_data.get('name')}")
-        return False
+            logger.debug(f"✅ Inserted {inserted}/{len(rows)} startups")
+            return inserted
     except Exception as e:
-        logger.error(f"❌ Error inserting startup: {e}")
-        return False
+        logger.error(f"❌ Error bulk inserting startups: {e}")
+        return 0
+
+
+def iter_startups(tier: Optional[str] = None) -> Iterator[Dict]:
+    """Stream startups from the database one row at a time.
+
+    Args:
+        tier: Only yield startups with this primary tier (ordered by fit score);
+            all startups (newest first) when None
+
+    Yields:
+        Startup rows as dicts
+
+    The shared connection stays locked until the generator is exhausted or
+    closed.
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 200
+            if tier is None:
+                cursor.execute("SELECT * FROM startups ORDER BY created_at DESC")
+            else:
+                cursor.execute(
+                    "SELECT * FROM startups WHERE primary_tier = ? ORDER BY india_fit_score DESC",
+                    (tier,)
+                )
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+    except Exception as e:
+        logger.error(f"❌ Error retrieving startups: {e}")
 
 
 def get_all_startups() -> List[Dict]:
     """Get all startups from database."""
+    startups = list(iter_startups())
+    logger.debug(f"✅ Retrieved {len(startups)} startups")
+    return startups
+
+
+def get_startups_by_tier(tier: str) -> List[Dict]:
+    """Get startups by tier."""
+    startups = list(iter_startups(tier))
+    logger.debug(f"✅ Retrieved {len(startups)} startups for tier {tier}")
+    return startups
+
+
+def get_all_startups_columnar() -> Dict[str, List[Any]]:
+    """Get all startups as parallel column lists (newest first).
+
+    Rows are transposed once, so scans over a single field (e.g. every
+    india_fit_score) walk one list instead of looking a key up per dict.
+
+    Returns:
+        Mapping of column name to values in row order; every list has the
+        same length
+    """
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM startups ORDER BY created_at DESC")
-            startups = [dict(row) for row in cursor.fetchall()]
-            logger.debug(f"✅ Retrieved {len(startups)} startups")
-            return startups
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+            columns = list(zip(*rows)) if rows else [()] * len(names)
+            logger.debug(f"✅ Retrieved {len(rows)} startups (columnar)")
+            return {name: list(values) for name, values in zip(names, columns)}
     except Exception as e:
         logger.error(f"❌ Error retrieving startups: {e}")
-        return []
+        return {}
 
 
-def get_startups_by_tier(tier: str) -> List[Dict]:
-    """Get startups by tier."""
+def get_tier_counts() -> Dict[Optional[str], int]:
+    """Get startup counts per primary tier in a single aggregate query."""
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM startups WHERE primary_tier = ? ORDER BY india_fit_score DESC",
-                (tier,)
-            )
-            startups = [dict(row) for row in cursor.fetchall()]
-            logger.debug(f"✅ Retrieved {len(startups)} startups for tier {tier}")
-            return startups
+            cursor.execute("SELECT primary_tier, COUNT(*) FROM startups GROUP BY primary_tier")
+            counts = {row[0]: row[1] for row in cursor.fetchall()}
+            logger.debug(f"✅ Retrieved tier counts: {counts}")
+            return counts
     except Exception as e:
-        logger.error(f"❌ Error retrieving startups by tier: {e}")
-        return []
+        logger.error(f"❌ Error retrieving tier counts: {e}")
+        return {}
 
 
 def insert_run_metadata(run_data: Dict[str, Any]) -> bool:
@@ -8,7 +8,11 @@ from .schemas import (
     DiscoveryOutput,
     MarketAnalysisOutput,
     TierAnalysisOutput,
-    ReportSummary
+    ReportSummary,
+    STARTUP_LIST_ADAPTER,
+    MARKET_LIST_ADAPTER,
+    TIER_LIST_ADAPTER,
+    validate_startups
 )
 
 __all__ = [
@@ -19,6 +23,10 @@ __all__ = [
     "DiscoveryOutput",
     "MarketAnalysisOutput",
     "TierAnalysisOutput",
-    "ReportSummary"
+    "ReportSummary",
+    "STARTUP_LIST_ADAPTER",
+    "MARKET_LIST_ADAPTER",
+    "TIER_LIST_ADAPTER",
+    "validate_startups"
 ]
 
@@ -1,24 +1,32 @@
-"""Pydantic models for structured data."""
+"""Models for structured data.
 
-from typing import List, Optional, Dict, Any
+Internal containers are slotted dataclasses, so building them from
+already-parsed agent JSON costs no validation. Untrusted LLM output is
+validated once at the boundary with validate_startups (pydantic validates
+stdlib dataclasses through TypeAdapter, honouring the Annotated constraints).
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Annotated, List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
 
 
-class StartupBasic(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StartupBasic:
     """Basic startup information."""
-    name: str = Field(..., description="Startup name")
-    website: Optional[str] = Field(None, description="Website URL")
-    description: Optional[str] = Field(None, description="Brief description")
-    category: str = Field(..., description="Business category")
-    founded_date: Optional[str] = Field(None, description="Founded date")
-    country: str = Field(..., description="Country of origin")
-    founder_info: Optional[str] = Field(None, description="Founder information")
-    source: Optional[str] = Field(None, description="Source of information")
-    source_url: Optional[str] = Field(None, description="Source URL")
-
-    class Config:
-        json_schema_extra = {
+    name: Annotated[str, Field(description="Startup name")]
+    website: Annotated[Optional[str], Field(description="Website URL")] = None
+    description: Annotated[Optional[str], Field(description="Brief description")] = None
+    category: Annotated[str, Field(description="Business category")]
+    founded_date: Annotated[Optional[str], Field(description="Founded date")] = None
+    country: Annotated[str, Field(description="Country of origin")]
+    founder_info: Annotated[Optional[str], Field(description="Founder information")] = None
+    source: Annotated[Optional[str], Field(description="Source of information")] = None
+    source_url: Annotated[Optional[str], Field(description="Source URL")] = None
+
+    __pydantic_config__ = ConfigDict(json_schema_extra={
             "example": {
                 "name": "TechStartup Inc",
                 "website": "https://techstartup.com",
@@ -30,13 +38,20 @@ class StartupBasic(BaseModel):
                 "source": "Product Hunt",
                 "source_url": "https://producthunt.com/..."
             }
-        }
+        })
+
+
+# Range check compiled into pydantic-core; shared by every fit score field
+FitScore = Annotated[int, Field(ge=0, le=100)]
+
+# Analysis models are immutable once validated and tolerate extra LLM keys
+_ANALYSIS_CONFIG = ConfigDict(frozen=True, extra='ignore')
 
 
 class StartupMarketAnalysis(BaseModel):
     """Market fit analysis for a startup."""
     startup_name: str = Field(..., description="Startup name")
-    india_fit_score: int = Field(..., ge=0, le=100, description="India market fit score 0-100")
+    india_fit_score: Annotated[FitScore, Field(description="India market fit score 0-100")]
     market_demand: str = Field(..., description="Market demand assessment")
     competition_analysis: str = Field(..., description="Competition landscape")
     regulatory_considerations: str = Field(..., description="Regulatory environment")
@@ -44,8 +59,7 @@ class StartupMarketAnalysis(BaseModel):
     recommended_adaptations: List[str] = Field(default_factory=list, description="Recommended changes")
     barriers: List[str] = Field(default_factory=list, description="Potential barriers")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(**_ANALYSIS_CONFIG, json_schema_extra={
             "example": {
                 "startup_name": "TechStartup Inc",
                 "india_fit_score": 85,
@@ -56,7 +70,17 @@ class StartupMarketAnalysis(BaseModel):
                 "recommended_adaptations": ["Localize content", "Partner with local vendors"],
                 "barriers": ["High customer acquisition cost"]
             }
-        }
+        })
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "StartupMarketAnalysis":
+        """Build from already-validated data without re-running validators.
+
+        Only for data that has passed model_validate once (e.g. one agent's
+        validated output handed to the next); raw LLM output must go through
+        model_validate.
+        """
+        return cls.model_construct(**data)
 
 
 class StartupTierAnalysis(BaseModel):
@@ -68,8 +92,7 @@ class StartupTierAnalysis(BaseModel):
     market_size_estimate: str = Field(..., description="Market size estimate")
     potential_revenue_opportunity: str = Field(..., description="Revenue opportunity")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(**_ANALYSIS_CONFIG, json_schema_extra={
             "example": {
                 "startup_name": "TechStartup Inc",
                 "primary_tier": "Tier 1",
@@ -78,12 +101,23 @@ class StartupTierAnalysis(BaseModel):
                 "market_size_estimate": "High",
                 "potential_revenue_opportunity": "Significant"
             }
-        }
+        })
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "StartupTierAnalysis":
+        """Build from already-validated data without re-running validators.
 
+        Only for data that has passed model_validate once (e.g. one agent's
+        validated output handed to the next); raw LLM output must go through
+        model_validate.
+        """
+        return cls.model_construct(**data)
+
+
+@dataclass(slots=True, kw_only=True)
 class StartupComplete(StartupBasic):
     """Complete startup information with analysis."""
-    india_fit_score: int = Field(default=0, ge=0, le=100)
+    india_fit_score: FitScore = 0
     india_fit_analysis: Optional[str] = None
     primary_tier: Optional[str] = None
     secondary_tiers: Optional[List[str]] = None
@@ -91,68 +125,126 @@ class StartupComplete(StartupBasic):
     potential_revenue_opportunity: Optional[str] = None
 
 
-class DiscoveryOutput(BaseModel):
+def _from_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() value to a local datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+@dataclass(slots=True, kw_only=True)
+class DiscoveryOutput:
     """Output from discovery agent."""
-    startups_found: int = Field(..., description="Number of startups found")
-    startups: List[StartupBasic] = Field(..., description="List of discovered startups")
-    search_queries_used: List[str] = Field(default_factory=list, description="Queries used")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    startups_found: Annotated[int, Field(description="Number of startups found")]
+    startups: Annotated[List[StartupBasic], Field(description="List of discovered startups")]
+    search_queries_used: Annotated[List[str], Field(description="Queries used")] = field(default_factory=list)
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
-    class Config:
-        json_schema_extra = {
+    __pydantic_config__ = ConfigDict(json_schema_extra={
             "example": {
                 "startups_found": 5,
                 "startups": [],
                 "search_queries_used": ["startup founded last month"],
-                "timestamp": "2024-11-02T10:00:00"
+                "timestamp_ns": 1730541600000000000
             }
-        }
+        })
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return _from_ns(self.timestamp_ns)
 
 
-class MarketAnalysisOutput(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MarketAnalysisOutput:
     """Output from market fit analysis agent."""
-    analyzed_startups: int = Field(..., description="Number of startups analyzed")
-    analyses: List[StartupMarketAnalysis] = Field(..., description="Market analyses")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    analyzed_startups: Annotated[int, Field(description="Number of startups analyzed")]
+    analyses: Annotated[List[StartupMarketAnalysis], Field(description="Market analyses")]
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return _from_ns(self.timestamp_ns)
 
-class TierAnalysisOutput(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class TierAnalysisOutput:
     """Output from tier categorization agent."""
-    categorized_startups: int = Field(..., description="Number of startups categorized")
-    analyses: List[StartupTierAnalysis] = Field(..., description="Tier analyses")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    categorized_startups: Annotated[int, Field(description="Number of startups categorized")]
+    analyses: Annotated[List[StartupTierAnalysis], Field(description="Tier analyses")]
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return _from_ns(self.timestamp_ns)
 
 
-class ReportSummary(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ReportSummary:
     """Final report summary."""
-    run_id: str = Field(..., description="Unique run identifier")
-    run_date: datetime = Field(default_factory=datetime.now)
-    total_startups_found: int = Field(..., description="Total startups discovered")
-    tier_1_count: int = Field(default=0)
-    tier_2_count: int = Field(default=0)
-    tier_3_count: int = Field(default=0)
-    top_opportunities: List[StartupComplete] = Field(default_factory=list)
-    trending_categories: List[str] = Field(default_factory=list)
-    market_gaps: List[str] = Field(default_factory=list)
-    opportunities: List[str] = Field(default_factory=list)
-    recommendations: List[str] = Field(default_factory=list)
-    generated_at: datetime = Field(default_factory=datetime.now)
-
-    class Config:
-        json_schema_extra = {
+    run_id: Annotated[str, Field(description="Unique run identifier")]
+    run_date_ns: int = field(default_factory=time.time_ns)
+    total_startups_found: Annotated[int, Field(description="Total startups discovered")]
+    tier_1_count: int = 0
+    tier_2_count: int = 0
+    tier_3_count: int = 0
+    top_opportunities: Annotated[
+        List[str], Field(description="Names of the top startups, already stored in the database")
+    ] = field(default_factory=list)
+    trending_categories: List[str] = field(default_factory=list)
+    market_gaps: List[str] = field(default_factory=list)
+    opportunities: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    generated_at_ns: int = field(default_factory=time.time_ns)
+
+    __pydantic_config__ = ConfigDict(json_schema_extra={
             "example": {
                 "run_id": "run_20241102_100000",
-                "run_date": "2024-11-02T10:00:00",
+                "run_date_ns": 1730541600000000000,
                 "total_startups_found": 20,
                 "tier_1_count": 10,
                 "tier_2_count": 7,
                 "tier_3_count": 3,
-                "top_opportunities": [],
+                "top_opportunities": ["TechStartup Inc"],
                 "trending_categories": ["AI/ML", "FinTech"],
                 "market_gaps": ["Localized solutions"],
                 "opportunities": ["Partnership opportunities"],
                 "recommendations": ["Focus on Tier 1 cities"],
-                "generated_at": "2024-11-02T10:30:00"
+                "generated_at_ns": 1730543400000000000
             }
-        }
+        })
+
+    @property
+    def run_date(self) -> datetime:
+        """Run date as a local datetime."""
+        return _from_ns(self.run_date_ns)
+
+    @property
+    def generated_at(self) -> datetime:
+        """Generation time as a local datetime."""
+        return _from_ns(self.generated_at_ns)
+
+
+# Compiled once at import; building a TypeAdapter compiles its schema
+STARTUP_LIST_ADAPTER = TypeAdapter(List[StartupBasic])
+MARKET_LIST_ADAPTER = TypeAdapter(List[StartupMarketAnalysis])
+TIER_LIST_ADAPTER = TypeAdapter(List[StartupTierAnalysis])
+
+
+def validate_startups(data: Any) -> List[StartupBasic]:
+    """Validate raw (LLM-produced) startup records once at the boundary.
+
+    Args:
+        data: JSON text/bytes, or an already-parsed list of startup dicts.
+            Text is validated in a single pydantic-core pass without an
+            intermediate json.loads.
+
+    Returns:
+        Validated StartupBasic instances
 
+    Raises:
+        pydantic.ValidationError: If any record is invalid
+    """
+    if isinstance(data, (str, bytes)):
+        return STARTUP_LIST_ADAPTER.validate_json(data)
+    return STARTUP_LIST_ADAPTER.validate_python(data)
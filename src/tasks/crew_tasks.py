@@ -1,6 +1,7 @@
 """CrewAI tasks for startup research."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from crewai import Task
 from ..agents.crew_agents import (
     create_discovery_agent,
@@ -11,11 +12,8 @@ from ..agents.crew_agents import (
 
 logger = logging.getLogger(__name__)
 
-
-def create_discovery_task(agent) -> Task:
-    """Create task for startup discovery."""
-    return Task(
-        description="""Search for startups founded in the last 1 month globally.
+# Task prompts are built once at import and shared by every Task instance
+_DISCOVERY_DESC = """Search for startups founded in the last 1 month globally.
         Use multiple sources:
         1. Google Search for "startup founded last month"
         2. Product Hunt for recent launches
@@ -32,8 +30,9 @@ def create_discovery_task(agent) -> Task:
         - Founder information
 
         Return a JSON array of at least 20 startups with complete information.
-        Format: [{"name": "...", "website": "...", "description": "...", "category": "...", "founded_date": "...", "country": "...", "source": "..."}]""",
-        expected_output="""A JSON array of startups with this exact format:
+        Format: [{"name": "...", "website": "...", "description": "...", "category": "...", "founded_date": "...", "country": "...", "source": "..."}]"""
+
+_DISCOVERY_EXPECTED = """A JSON array of startups with this exact format:
         [
             {
                 "name": "Startup Name",
@@ -45,17 +44,14 @@ def create_discovery_task(agent) -> Task:
                 "source": "Source name"
             }
         ]
-        Return ONLY valid JSON, no other text.""",
-        agent=agent,
-        async_execution=False
-    )
+        Return ONLY valid JSON, no other text."""
 
+_MARKET_FIT_DESC = """Analyze the following startup for India market fit.
 
-def create_market_fit_task(agent) -> Task:
-    """Create task for India market fit analysis."""
-    return Task(
-        description="""Analyze each startup for India market fit.
-        For each startup, evaluate:
+        Startup:
+        {startup}
+
+        Evaluate:
         1. Market demand in India (0-100)
         2. Competition landscape
         3. Regulatory environment
@@ -69,8 +65,9 @@ def create_market_fit_task(agent) -> Task:
         - 40-59: Moderate fit
         - 0-39: Poor fit
 
-        Return results as a JSON array with detailed analysis for each startup.""",
-        expected_output="""Return a JSON array with this exact format:
+        Return results as a JSON array with detailed analysis for the startup."""
+
+_MARKET_FIT_EXPECTED = """Return a JSON array with this exact format:
         [
             {
                 "name": "Startup Name",
@@ -83,22 +80,18 @@ def create_market_fit_task(agent) -> Task:
                 "recommended_adaptations": "List of adaptations"
             }
         ]
-        Return ONLY valid JSON, no other text.""",
-        agent=agent,
-        async_execution=False
-    )
+        Return ONLY valid JSON, no other text."""
 
+_TIER_DESC = """Categorize the following startup by city tier.
 
-def create_tier_task(agent) -> Task:
-    """Create task for tier categorization."""
-    return Task(
-        description="""Categorize each startup by city tier.
+        Startup:
+        {startup}
 
         Tier 1 Cities: Delhi, Mumbai, Bangalore
         Tier 2 Cities: Pune, Hyderabad, Chennai
         Tier 3 Cities: Jaipur, Lucknow, Chandigarh, Ahmedabad, Kolkata
 
-        For each startup, determine:
+        Determine:
         1. Primary tier (best market fit)
         2. Secondary tiers (alternative markets)
         3. Reasoning for categorization
@@ -110,8 +103,9 @@ def create_tier_task(agent) -> Task:
         - Investor presence
         - Cost of operations
 
-        Return results as a JSON array.""",
-        expected_output="""Return a JSON array with this exact format:
+        Return results as a JSON array."""
+
+_TIER_EXPECTED = """Return a JSON array with this exact format:
         [
             {
                 "name": "Startup Name",
@@ -122,53 +116,79 @@ def create_tier_task(agent) -> Task:
                 "revenue_opportunity": "High/Medium/Low"
             }
         ]
-        Return ONLY valid JSON, no other text.""",
-        agent=agent,
-        async_execution=False
-    )
+        Return ONLY valid JSON, no other text."""
 
+_REPORT_DESC = """Generate a comprehensive monthly summary report from the analyzed startups below.
 
-def create_report_task(agent) -> Task:
-    """Create task for report generation."""
-    return Task(
-        description="""Generate a comprehensive monthly summary report.
+        Analyzed startups:
+        {startups}
 
         Include:
         1. Executive summary
         2. Total startups found
-        3. Breakdown by tier:
-           - Tier 1 count and top opportunities
-           - Tier 2 count and top opportunities
-           - Tier 3 count and top opportunities
+        3. Count per tier (Tier 1, Tier 2, Tier 3)
         4. Market insights:
            - Trending categories
            - Market gaps
            - Opportunities
-        5. Top 10 opportunities with details INCLUDING tier classification for each
+        5. Top 10 opportunities by name
         6. Recommendations
 
-        IMPORTANT: For the top_opportunities array, include BOTH india_fit_score AND primary_tier for each startup.
-        Format as JSON for easy consumption.""",
-        expected_output="""A JSON report containing:
+        IMPORTANT: Startup details are already stored in the database. List top_opportunities
+        as startup names only - do not repeat scores, tiers or other fields.
+        Keep the report concise and format it as JSON for easy consumption."""
+
+_REPORT_EXPECTED = """A concise JSON report containing:
         - run_id
         - run_date
         - total_startups_found
-        - by_tier breakdown
-        - top_opportunities (top 10) - MUST include "primary_tier" field for each startup
-        - market_insights
+        - tier_1_count, tier_2_count, tier_3_count
+        - top_opportunities (top 10) - startup names only
+        - trending_categories
+        - market_gaps
+        - opportunities
         - recommendations
         - generated_at timestamp
 
         Example top_opportunities format:
-        [
-            {
-                "name": "Startup Name",
-                "india_fit_score": 75,
-                "primary_tier": "Tier 1",
-                "secondary_tiers": ["Tier 2"],
-                ...other fields...
-            }
-        ]""",
+        ["Startup Name", "Another Startup"]"""
+
+
+def create_discovery_task(agent) -> Task:
+    """Create task for startup discovery."""
+    return Task(
+        description=_DISCOVERY_DESC,
+        expected_output=_DISCOVERY_EXPECTED,
+        agent=agent,
+        async_execution=False
+    )
+
+
+def create_market_fit_task(agent) -> Task:
+    """Create task for India market fit analysis."""
+    return Task(
+        description=_MARKET_FIT_DESC,
+        expected_output=_MARKET_FIT_EXPECTED,
+        agent=agent,
+        async_execution=False
+    )
+
+
+def create_tier_task(agent) -> Task:
+    """Create task for tier categorization."""
+    return Task(
+        description=_TIER_DESC,
+        expected_output=_TIER_EXPECTED,
+        agent=agent,
+        async_execution=False
+    )
+
+
+def create_report_task(agent) -> Task:
+    """Create task for report generation."""
+    return Task(
+        description=_REPORT_DESC,
+        expected_output=_REPORT_EXPECTED,
         agent=agent,
         async_execution=False
     )
@@ -176,10 +196,17 @@ def create_report_task(agent) -> Task:
 
 def create_all_tasks():
     """Create all tasks."""
-    discovery_agent = create_discovery_agent()
-    market_fit_agent = create_market_fit_agent()
-    tier_agent = create_tier_agent()
-    report_agent = create_report_agent()
+    # Agent construction initializes LLM clients, so build the agents concurrently
+    agent_factories = [
+        create_discovery_agent,
+        create_market_fit_agent,
+        create_tier_agent,
+        create_report_agent
+    ]
+    with ThreadPoolExecutor(max_workers=len(agent_factories)) as executor:
+        discovery_agent, market_fit_agent, tier_agent, report_agent = executor.map(
+            lambda factory: factory(), agent_factories
+        )
     
     tasks = [
         create_discovery_task(discovery_agent),
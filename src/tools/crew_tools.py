@@ -1,7 +1,10 @@
 """CrewAI BaseTool implementations for startup research."""
 
+import functools
 from crewai.tools import BaseTool
 from typing import List, Dict, Any
+from ..cache.singleflight import singleflight
+from ..utils.json_utils import dumps
 from .search_tools import (
     search_google as search_google_impl,
     search_product_hunt as search_product_hunt_impl,
@@ -9,6 +12,13 @@ from .search_tools import (
     search_recent_startups as search_recent_startups_impl
 )
 
+search_google_shared = singleflight(
+    lambda query, num_results=10: (" ".join(query.lower().split()), num_results)
+)(search_google_impl)
+fetch_url_content_shared = singleflight(
+    lambda url: url.strip().rstrip("/")
+)(fetch_url_content_impl)
+
 
 class SearchGoogleTool(BaseTool):
     """Tool for searching using Google Custom Search API."""
@@ -17,8 +27,8 @@ class SearchGoogleTool(BaseTool):
     
     def _run(self, query: str, num_results: int = 10) -> str:
         """Execute the search."""
-        results = search_google_impl(query, num_results)
-        return str(results)
+        results = search_google_shared(query, num_results)
+        return dumps(results).decode()
 
 
 class SearchProductHuntTool(BaseTool):
@@ -29,7 +39,7 @@ class SearchProductHuntTool(BaseTool):
     def _run(self, query: str = "") -> str:
         """Execute the search."""
         results = search_product_hunt_impl(query)
-        return str(results)
+        return dumps(results).decode()
 
 
 class FetchUrlContentTool(BaseTool):
@@ -39,7 +49,7 @@ class FetchUrlContentTool(BaseTool):
     
     def _run(self, url: str) -> str:
         """Execute the fetch."""
-        content = fetch_url_content_impl(url)
+        content = fetch_url_content_shared(url)
         return content
 
 
@@ -51,12 +61,47 @@ class SearchRecentStartupsTool(BaseTool):
     def _run(self, days: int = 30) -> str:
         """Execute the search."""
         results = search_recent_startups_impl(days)
-        return str(results)
+        return dumps(results).decode()
+
+
+# Tool instances are built on first use: each BaseTool construction builds a
+# pydantic schema, which importers that only need one tool shouldn't pay for
+@functools.lru_cache(maxsize=None)
+def get_search_google_tool() -> SearchGoogleTool:
+    """Shared SearchGoogleTool instance."""
+    return SearchGoogleTool()
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_product_hunt_tool() -> SearchProductHuntTool:
+    """Shared SearchProductHuntTool instance."""
+    return SearchProductHuntTool()
+
+
+@functools.lru_cache(maxsize=None)
+def get_fetch_url_content_tool() -> FetchUrlContentTool:
+    """Shared FetchUrlContentTool instance."""
+    return FetchUrlContentTool()
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_recent_startups_tool() -> SearchRecentStartupsTool:
+    """Shared SearchRecentStartupsTool instance."""
+    return SearchRecentStartupsTool()
+
+
+_TOOL_FACTORIES = {
+    "search_google_tool": get_search_google_tool,
+    "search_product_hunt_tool": get_search_product_hunt_tool,
+    "fetch_url_content_tool": get_fetch_url_content_tool,
+    "search_recent_startups_tool": get_search_recent_startups_tool,
+}
 
 
-# Create tool instances
-search_google_tool = SearchGoogleTool()
-search_product_hunt_tool = SearchProductHuntTool()
-fetch_url_content_tool = FetchUrlContentTool()
-search_recent_startups_tool = SearchRecentStartupsTool()
+def __getattr__(name: str):
+    """Keep `from crew_tools import search_google_tool` working lazily (PEP 562)."""
+    factory = _TOOL_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
 
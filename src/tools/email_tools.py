@@ -1,19 +1,74 @@
 """Email notification tools for sending reports."""
 
 import os
-import json
+import io
+import gzip
+import base64
+import asyncio
 import logging
 import smtplib
+import threading
 from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
+from email import policy
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from itertools import starmap
 
 logger = logging.getLogger(__name__)
 
+# base64.encodebytes emits one 76-char MIME line per 57 input bytes, so
+# reading in multiples of 57 lets encoded chunks be concatenated as-is
+ATTACHMENT_CHUNK_SIZE = 57 * 1150  # ~64 KiB
+
+# Static parts of the report email, split around the fields that vary
+_HTML_HEAD = """
+        <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                    <h2 style="color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px;">
+                        📊 Startup Research Report
+                    </h2>
+                    
+                    <p><strong>Run ID:</strong> """
+_HTML_GENERATED = """</p>
+                    <p><strong>Generated:</strong> """
+_HTML_SUMMARY = """</p>
+                    
+                    <h3 style="color: #34495e; margin-top: 20px;">Summary</h3>
+                    <ul style="background-color: #ecf0f1; padding: 15px 30px; border-radius: 5px;">
+                        <li><strong>Total Startups Found:</strong> """
+_HTML_TIERS = """</li>
+                        """
+_TIER_LI = "<li><strong>{}:</strong> {} startups</li>".format
+_HTML_TAIL = """
+                    </ul>
+                    
+                    <h3 style="color: #34495e; margin-top: 20px;">Report Files</h3>
+                    <p>The following files are attached:</p>
+                    <ul>
+                        <li>agents_summary.json - Summary and full report of every agent</li>
+                    </ul>
+                    
+                    <h3 style="color: #34495e; margin-top: 20px;">Next Steps</h3>
+                    <ol>
+                        <li>Review the attached reports</li>
+                        <li>Check the database for detailed startup information</li>
+                        <li>Analyze market opportunities by tier</li>
+                    </ol>
+                    
+                    <hr style="border: none; border-top: 1px solid #bdc3c7; margin: 20px 0;">
+                    <p style="color: #7f8c8d; font-size: 12px;">
+                        This is an automated email from the Startup Research Agent.
+                        Please do not reply to this email.
+                    </p>
+                </div>
+            </body>
+        </html>
+        """
+
 
 class EmailNotifier:
     """Send email notifications with reports."""
@@ -24,6 +79,7 @@ class EmailNotifier:
         smtp_port: int = 587,
         sender_email: Optional[str] = None,
         sender_password: Optional[str] = None,
+        compress_attachments: bool = False,
     ):
         """Initialize email notifier.
         
@@ -32,12 +88,80 @@ class EmailNotifier:
             smtp_port: SMTP server port
             sender_email: Sender email address (from env if not provided)
             sender_password: Sender email password (from env if not provided)
+            compress_attachments: Gzip report files before attaching them
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email or os.getenv("EMAIL_SENDER")
         self.sender_password = sender_password or os.getenv("EMAIL_PASSWORD")
         self.is_configured = bool(self.sender_email and self.sender_password)
+        self.compress_attachments = compress_attachments
+        self._server: Optional[smtplib.SMTP] = None
+        self._server_lock = threading.Lock()
+
+    def __enter__(self) -> "EmailNotifier":
+        """Open one authenticated SMTP connection shared by sends in the block.
+
+        Usage:
+            with EmailNotifier() as notifier:
+                for report in reports:
+                    notifier.send_report_email(...)
+
+        A connection failure is logged rather than raised; sends in the
+        block then open their own connection and report failure by
+        returning False.
+        """
+        if self.is_configured:
+            try:
+                self._server = self._connect()
+            except (smtplib.SMTPException, OSError) as e:
+                logger.error(f"❌ Failed to connect to SMTP server: {e}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Close the shared SMTP connection."""
+        with self._server_lock:
+            server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except smtplib.SMTPException as e:
+                logger.debug(f"SMTP quit failed: {e}")
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection with STARTTLS and log in.
+
+        The socket is closed if STARTTLS or login fails.
+        """
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _deliver(self, msg: MIMEMultipart, recipient_emails: List[str]) -> None:
+        """Send over the shared connection if one is open, else a one-off connection."""
+        # Serialize the MIME tree once (CRLF line endings, as SMTP expects)
+        # rather than letting send_message regenerate it
+        raw = msg.as_bytes(policy=policy.SMTP)
+
+        if self._server is None:
+            with self._connect() as server:
+                server.sendmail(self.sender_email, recipient_emails, raw)
+            return
+
+        with self._server_lock:
+            # NOOP keeps the channel alive between sends and detects a
+            # connection the server has dropped, which is then reopened
+            try:
+                self._server.noop()
+            except (smtplib.SMTPException, OSError):
+                self._server.close()
+                self._server = self._connect()
+            self._server.sendmail(self.sender_email, recipient_emails, raw)
 
     def send_report_email(
         self,
@@ -82,10 +206,7 @@ class EmailNotifier:
             self._attach_files(msg, report_dir)
 
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            self._deliver(msg, recipient_emails)
 
             logger.info(f"✅ Email sent to {', '.join(recipient_emails)}")
             return True
@@ -94,81 +215,104 @@ class EmailNotifier:
             logger.error(f"❌ Failed to send email: {e}")
             return False
 
+    async def send_report_email_async(self, **kwargs) -> bool:
+        """Send a report email without blocking the event loop.
+
+        smtplib runs in a worker thread, so several sends awaited together
+        overlap their TLS handshakes and SMTP round trips.
+
+        Args:
+            **kwargs: Arguments for send_report_email
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        return await asyncio.to_thread(self.send_report_email, **kwargs)
+
+    async def send_report_emails_async(self, emails: List[Dict[str, Any]]) -> List[bool]:
+        """Send several independent report emails concurrently.
+
+        The sends share one authenticated SMTP connection, opened here
+        unless the caller's ``with`` block already holds one.
+
+        Args:
+            emails: One dict of send_report_email arguments per email
+                (e.g. different recipient groups or runs)
+
+        Returns:
+            Per-email success flags, in input order
+        """
+        owns_connection = self._server is None
+        if owns_connection:
+            await asyncio.to_thread(self.__enter__)
+        try:
+            return list(await asyncio.gather(
+                *(self.send_report_email_async(**email) for email in emails)
+            ))
+        finally:
+            if owns_connection:
+                await asyncio.to_thread(self.__exit__, None, None, None)
+
     def _create_html_body(
         self, run_id: str, startup_count: int, tier_breakdown: Dict[str, int]
     ) -> str:
         """Create HTML email body."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        tier_html = "".join([
-            f"<li><strong>{tier}:</strong> {count} startups</li>"
-            for tier, count in tier_breakdown.items()
-        ])
+        tier_html = "".join(starmap(_TIER_LI, tier_breakdown.items()))
 
-        html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px;">
-                        📊 Startup Research Report
-                    </h2>
-                    
-                    <p><strong>Run ID:</strong> {run_id}</p>
-                    <p><strong>Generated:</strong> {timestamp}</p>
-                    
-                    <h3 style="color: #34495e; margin-top: 20px;">Summary</h3>
-                    <ul style="background-color: #ecf0f1; padding: 15px 30px; border-radius: 5px;">
-                        <li><strong>Total Startups Found:</strong> {startup_count}</li>
-                        {tier_html}
-                    </ul>
-                    
-                    <h3 style="color: #34495e; margin-top: 20px;">Report Files</h3>
-                    <p>The following files are attached:</p>
-                    <ul>
-                        <li>agents_summary.json - Summary of all agents</li>
-                        <li>Individual agent reports (JSON)</li>
-                    </ul>
-                    
-                    <h3 style="color: #34495e; margin-top: 20px;">Next Steps</h3>
-                    <ol>
-                        <li>Review the attached reports</li>
-                        <li>Check the database for detailed startup information</li>
-                        <li>Analyze market opportunities by tier</li>
-                    </ol>
-                    
-                    <hr style="border: none; border-top: 1px solid #bdc3c7; margin: 20px 0;">
-                    <p style="color: #7f8c8d; font-size: 12px;">
-                        This is an automated email from the Startup Research Agent.
-                        Please do not reply to this email.
-                    </p>
-                </div>
-            </body>
-        </html>
-        """
-        return html
+        return "".join((
+            _HTML_HEAD, run_id,
+            _HTML_GENERATED, timestamp,
+            _HTML_SUMMARY, str(startup_count),
+            _HTML_TIERS, tier_html,
+            _HTML_TAIL,
+        ))
 
     def _attach_files(self, msg: MIMEMultipart, report_dir: Path) -> None:
         """Attach report files to email."""
-        if not report_dir.exists():
+        # Collect JSON files in one directory pass; DirEntry caches file type
+        try:
+            with os.scandir(report_dir) as entries:
+                json_files = sorted(
+                    (entry for entry in entries
+                     if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)),
+                    key=lambda entry: entry.name
+                )
+        except FileNotFoundError:
             logger.warning(f"Report directory not found: {report_dir}")
             return
 
         # Attach JSON files
-        for json_file in report_dir.glob("*.json"):
+        for json_file in json_files:
             try:
-                with open(json_file, "rb") as attachment:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(attachment.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        f"attachment; filename= {json_file.name}",
-                    )
-                    msg.attach(part)
-                logger.debug(f"Attached: {json_file.name}")
+                if self.compress_attachments:
+                    part = MIMEBase("application", "gzip")
+                    filename = f"{json_file.name}.gz"
+                    with open(json_file.path, "rb") as f:
+                        source = io.BytesIO(gzip.compress(f.read(), compresslevel=6))
+                else:
+                    part = MIMEBase("application", "json")
+                    filename = json_file.name
+                    source = open(json_file.path, "rb")
+
+                with source:
+                    part.set_payload(self._encode_base64_chunked(source))
+                part["Content-Transfer-Encoding"] = "base64"
+                part.add_header("Content-Disposition", "attachment", filename=filename)
+                msg.attach(part)
+                logger.debug(f"Attached: {filename}")
             except Exception as e:
                 logger.warning(f"Failed to attach {json_file.name}: {e}")
 
+    @staticmethod
+    def _encode_base64_chunked(source) -> str:
+        """Base64-encode a binary stream chunk by chunk into MIME lines."""
+        encoded = io.BytesIO()
+        while chunk := source.read(ATTACHMENT_CHUNK_SIZE):
+            encoded.write(base64.encodebytes(chunk))
+        return encoded.getvalue().decode("ascii")
+
 
 def send_startup_report_email(
     recipient_emails: List[str],
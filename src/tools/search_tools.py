@@ -1,63 +1,104 @@
 """Search and data gathering tools."""
 
 import logging
+import re
 import requests
+import xxhash
 import hashlib
-from typing import List, Dict, Any
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set
 from bs4 import BeautifulSoup
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ..cache.http_cache import disk_cached
+from ..database.db import normalize_startup_name, startup_name_hash
 from ..config.settings import (
     GOOGLE_API_KEY, GOOGLE_SEARCH_ENGINE_ID, REQUESTS_TIMEOUT,
-    DEDUPLICATION_THRESHOLD, MAX_RETRIES, RETRY_DELAY
+    DEDUPLICATION_THRESHOLD, MAX_RETRIES, RETRY_DELAY, SEARCH_CONCURRENCY,
+    SEARCH_CACHE_TTL, URL_CACHE_TTL
 )
 
 logger = logging.getLogger(__name__)
 
+_WS = re.compile(r'\s+')
 
-def search_google(query: str, num_results: int = 10) -> List[Dict[str, str]]:
-    """Search using Google Custom Search API with retry logic."""
+# Enough HTML to extract the first 1000 chars of visible text on nearly all pages
+FETCH_MAX_BYTES = 64 * 1024
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections and retry/backoff.
+
+    Reusing connections to the few hosts we query (Google, DuckDuckGo,
+    Product Hunt) saves the TCP+TLS handshake on every call.
+    """
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+@disk_cached(expire=SEARCH_CACHE_TTL, daily=True)
+def search_google(query: str, num_results: int = 10, days: Optional[int] = None) -> List[Dict[str, str]]:
+    """Search using Google Custom Search API (retries handled by the session).
+
+    Args:
+        query: Search query
+        num_results: Maximum results (API caps this at 10)
+        days: Restrict to pages from the last N days, newest first
+    """
     if not GOOGLE_API_KEY or not GOOGLE_SEARCH_ENGINE_ID:
         logger.warning("⚠️  Google API keys not configured")
         return []
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                "q": query,
-                "key": GOOGLE_API_KEY,
-                "cx": GOOGLE_SEARCH_ENGINE_ID,
-                "num": min(num_results, 10)
-            }
-
-            response = requests.get(url, params=params, timeout=REQUESTS_TIMEOUT)
-            response.raise_for_status()
+    try:
+        url = "https://www.googleapis.com/customsearch/v1"
+        params = {
+            "q": query,
+            "key": GOOGLE_API_KEY,
+            "cx": GOOGLE_SEARCH_ENGINE_ID,
+            "num": min(num_results, 10)
+        }
+        if days:
+            params["dateRestrict"] = f"d{days}"
+            params["sort"] = "date"
 
-            results = []
-            data = response.json()
+        response = _SESSION.get(url, params=params, timeout=REQUESTS_TIMEOUT)
+        response.raise_for_status()
 
-            if "items" in data:
-                for item in data["items"]:
-                    results.append({
-                        "title": item.get("title", ""),
-                        "link": item.get("link", ""),
-                        "snippet": item.get("snippet", "")
-                    })
+        results = []
+        data = response.json()
 
-            logger.info(f"✅ Google search found {len(results)} results for: {query}")
-            return results
-        except requests.RequestException as e:
-            logger.warning(f"⚠️  Google search attempt {attempt + 1}/{MAX_RETRIES} failed: {e}")
-            if attempt < MAX_RETRIES - 1:
-                import time
-                time.sleep(RETRY_DELAY)
-        except Exception as e:
-            logger.error(f"❌ Unexpected error in Google search: {e}")
-            return []
+        if "items" in data:
+            for item in data["items"]:
+                results.append({
+                    "title": item.get("title", ""),
+                    "link": item.get("link", ""),
+                    "snippet": item.get("snippet", "")
+                })
 
-    logger.error(f"❌ Google search failed after {MAX_RETRIES} attempts")
-    return []
+        logger.info(f"✅ Google search found {len(results)} results for: {query}")
+        return results
+    except requests.RequestException as e:
+        logger.error(f"❌ Google search failed after {MAX_RETRIES} retries: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"❌ Unexpected error in Google search: {e}")
+        return []
 
 
 def search_product_hunt(query: str) -> List[Dict[str, str]]:
@@ -75,7 +116,7 @@ def search_product_hunt(query: str) -> List[Dict[str, str]]:
             "per_page": 20
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=REQUESTS_TIMEOUT)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=REQUESTS_TIMEOUT)
         response.raise_for_status()
         
         results = []
@@ -95,55 +136,221 @@ def search_product_hunt(query: str) -> List[Dict[str, str]]:
         return []
 
 
-def fetch_url_content(url: str) -> str:
-    """Fetch and extract text content from a URL."""
-    try:
-        response = requests.get(url, timeout=REQUESTS_TIMEOUT)
+@disk_cached(expire=URL_CACHE_TTL)
+def _fetch_and_extract(url: str) -> str:
+    """Download a page and return its first 1000 chars of visible text.
+
+    Raises on network errors, so failures are never memoized.
+    """
+    # Stream and stop after FETCH_MAX_BYTES; the Range header lets servers
+    # that honor it skip sending the rest of the page at all
+    headers = {"Range": f"bytes=0-{FETCH_MAX_BYTES - 1}"}
+    with _SESSION.get(url, headers=headers, stream=True, timeout=REQUESTS_TIMEOUT) as response:
         response.raise_for_status()
+        content = response.raw.read(FETCH_MAX_BYTES, decode_content=True)
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(content, 'lxml')
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
 
-        # Get text
-        text = soup.get_text()
+    # Get text and collapse whitespace in one pass
+    text = soup.get_text(separator=' ')
+    return _WS.sub(' ', text).strip()[:1000]  # Return first 1000 chars
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
 
-        return text[:1000]  # Return first 1000 chars
+def fetch_url_content(url: str) -> str:
+    """Fetch and extract text content from a URL (cached on disk per URL)."""
+    try:
+        return _fetch_and_extract(url)
     except Exception as e:
         print(f"⚠️  Error fetching URL: {e}")
         return ""
 
 
 def generate_hash(name: str, website: str, founded_date: str) -> str:
-    """Generate hash for deduplication."""
-    data = f"{name.lower()}{website.lower()}{founded_date}".encode()
-    return hashlib.md5(data).hexdigest()
+    """Generate hash for deduplication (64-bit xxh3, not for security)."""
+    return _hash_fields(name.lower(), website.lower(), founded_date)
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash_fields(name: str, website: str, founded_date: str) -> str:
+    """Memoized hash of already-lowercased fields, so case variants share an entry."""
+    # Join with a unit separator (never present in names/URLs) and encode
+    # once, so ("ab", "c") and ("a", "bc") hash differently
+    return xxhash.xxh3_64_hexdigest(f"{name}\x1f{website}\x1f{founded_date}".encode())
 
 
 def fuzzy_match(str1: str, str2: str, threshold: float = DEDUPLICATION_THRESHOLD) -> bool:
     """Check if two strings are similar using fuzzy matching."""
-    ratio = SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-    return ratio >= threshold
+    # ratio() is at most 2*min(len)/(sum of lens): reject on lengths alone
+    # before lowercasing or scoring anything
+    len1, len2 = len(str1), len(str2)
+    if 2 * min(len1, len2) < threshold * (len1 + len2):
+        return False
+    # score_cutoff lets rapidfuzz stop early; scores below it come back as 0
+    cutoff = threshold * 100
+    return fuzz.ratio(str1.lower(), str2.lower(), score_cutoff=cutoff) >= cutoff
+
+
+def build_name_index(existing_startups: List[Dict[str, Any]]) -> Set[str]:
+    """Normalized names of existing startups, for exact-match dedup lookups."""
+    return {normalize_startup_name(s.get('name', '')) for s in existing_startups}
+
+
+def is_duplicate(startup_name: str, existing_startups: List[Dict[str, Any]],
+                 name_index: Optional[Set[str]] = None,
+                 threshold: float = DEDUPLICATION_THRESHOLD,
+                 names_lower: Optional[List[str]] = None) -> bool:
+    """Check if startup is duplicate using exact then fuzzy matching.
+
+    Args:
+        startup_name: Candidate startup name
+        existing_startups: Startups to compare against
+        name_index: Precomputed build_name_index(existing_startups); pass it
+            when checking many names against the same list
+        threshold: Fuzzy match threshold
+        names_lower: Precomputed lowercased names of existing_startups; pass
+            it alongside name_index to skip re-lowercasing on every call
+
+    Returns:
+        True if the name matches an existing startup
+    """
+    if name_index is None:
+        name_index = build_name_index(existing_startups)
+    if normalize_startup_name(startup_name) in name_index:
+        logger.debug(f"⚠️  Duplicate detected: {startup_name} (exact match)")
+        return True
+
+    if names_lower is None:
+        names_lower = [existing.get('name', '').lower() for existing in existing_startups]
+    match = _closest_name(startup_name.lower(), names_lower, threshold)
+    if match is not None:
+        logger.debug(f"⚠️  Duplicate detected: {startup_name} matches {match}")
+        return True
+    return False
 
 
-def is_duplicate(startup_name: str, existing_startups: List[Dict[str, Any]]) -> bool:
-    """Check if startup is duplicate using fuzzy matching."""
-    for existing in existing_startups:
-        if fuzzy_match(startup_name, existing.get('name', '')):
-            logger.debug(f"⚠️  Duplicate detected: {startup_name} matches {existing.get('name')}")
-            return True
-    return False
+def find_duplicates(startup_names: List[str], existing_startups: List[Dict[str, Any]],
+                    threshold: float = DEDUPLICATION_THRESHOLD) -> List[bool]:
+    """Check many candidate names against the same existing startups.
+
+    The normalized-name index and the lowercased existing names are built
+    once for the whole batch rather than once per candidate.
 
+    Args:
+        startup_names: Candidate startup names
+        existing_startups: Startups to compare against
+        threshold: Fuzzy match threshold
 
-def search_web_fallback(query: str) -> List[Dict[str, Any]]:
-    """Fallback web search using DuckDuckGo (no API key required)."""
+    Returns:
+        Per-candidate duplicate flags, in input order
+    """
+    name_index = build_name_index(existing_startups)
+    names_lower = [existing.get('name', '').lower() for existing in existing_startups]
+    return [
+        normalize_startup_name(name) in name_index
+        or _closest_name(name.lower(), names_lower, threshold) is not None
+        for name in startup_names
+    ]
+
+
+def _closest_name(name_lower: str, names_lower: Iterable[str], threshold: float) -> Optional[str]:
+    """Best fuzzy match for name_lower among names_lower, or None below threshold.
+
+    Both sides must already be lowercased; no per-comparison processor runs.
+    """
+    # ratio() is at most 2*min(len)/(sum of lens), so skip names whose
+    # lengths alone rule out reaching the threshold
+    name_len = len(name_lower)
+    candidates = [
+        other for other in names_lower
+        if 2 * min(name_len, len(other)) >= threshold * (name_len + len(other))
+    ]
+    match = process.extractOne(
+        name_lower, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100
+    )
+    return match[0] if match else None
+
+
+class Deduper:
+    """Incremental duplicate filter over a growing set of startup names.
+
+    Each name is checked once against everything accepted so far: an exact
+    lookup on its normalized-name hash, then a fuzzy match only when that
+    misses. Accepted names are bucketed by length, and the fuzzy pass only
+    visits buckets whose length can still reach the threshold. Callers
+    replace ``if not is_duplicate(name, existing)`` with
+    ``if deduper.add(name)`` and no longer rescan the whole list per name.
+    """
+
+    def __init__(self, existing_names: Iterable[str] = (),
+                 threshold: float = DEDUPLICATION_THRESHOLD):
+        """Initialize deduper.
+
+        Args:
+            existing_names: Names already known (e.g. loaded from the database)
+            threshold: Fuzzy match threshold
+        """
+        self.threshold = threshold
+        self._seen_hashes: Set[str] = set()
+        self._names_by_len: Dict[int, List[str]] = {}
+        for name in existing_names:
+            self._remember(name)
+
+    def _remember(self, name: str, name_hash: Optional[str] = None) -> None:
+        """Index an accepted name for exact and fuzzy lookups."""
+        self._seen_hashes.add(name_hash or startup_name_hash(name))
+        name_lower = name.lower()
+        self._names_by_len.setdefault(len(name_lower), []).append(name_lower)
+
+    def _candidates(self, name_lower: str) -> Iterator[str]:
+        """Accepted (lowercased) names whose length does not rule out a fuzzy match."""
+        name_len = len(name_lower)
+        for length, names in self._names_by_len.items():
+            if 2 * min(name_len, length) >= self.threshold * (name_len + length):
+                yield from names
+
+    def add(self, name: str, name_hash: Optional[str] = None) -> bool:
+        """Record a name if it is new.
+
+        Args:
+            name: Candidate startup name
+            name_hash: startup_name_hash(name) if the caller already has it
+                (e.g. the row's dedup hash); computed here otherwise
+
+        Returns:
+            True if the name was novel and has been added, False if duplicate
+        """
+        name_hash = name_hash or startup_name_hash(name)
+        if name_hash in self._seen_hashes:
+            logger.debug(f"⚠️  Duplicate detected: {name} (exact match)")
+            return False
+
+        name_lower = name.lower()
+        match = _closest_name(name_lower, self._candidates(name_lower), self.threshold)
+        if match is not None:
+            logger.debug(f"⚠️  Duplicate detected: {name} matches {match}")
+            return False
+
+        self._remember(name, name_hash)
+        return True
+
+    def __len__(self) -> int:
+        """Number of distinct names accepted so far."""
+        return len(self._seen_hashes)
+
+
+@disk_cached(expire=SEARCH_CACHE_TTL, daily=True)
+def search_web_fallback(query: str, days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Fallback web search using DuckDuckGo (no API key required).
+
+    Args:
+        query: Search query
+        days: Restrict to roughly the last N days (DuckDuckGo only supports
+            day/week/month/year granularity, so this rounds up)
+    """
     try:
         # Using DuckDuckGo HTML search (no API key needed)
         url = "https://html.duckduckgo.com/"
@@ -151,18 +358,20 @@ def search_web_fallback(query: str) -> List[Dict[str, Any]]:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
         params = {"q": query}
+        if days:
+            params["df"] = "d" if days <= 1 else "w" if days <= 7 else "m" if days <= 31 else "y"
 
-        response = requests.get(url, params=params, headers=headers, timeout=REQUESTS_TIMEOUT)
+        response = _SESSION.get(url, params=params, headers=headers, timeout=REQUESTS_TIMEOUT)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         results = []
 
         # Extract results from DuckDuckGo
-        for result in soup.find_all('div', class_='result'):
+        for result in soup.select('div.result'):
             try:
-                title_elem = result.find('a', class_='result__a')
-                snippet_elem = result.find('a', class_='result__snippet')
+                title_elem = result.select_one('a.result__a')
+                snippet_elem = result.select_one('a.result__snippet')
 
                 if title_elem and snippet_elem:
                     results.append({
@@ -181,33 +390,37 @@ def search_web_fallback(query: str) -> List[Dict[str, Any]]:
         return []
 
 
+def _search_with_fallback(query: str, days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Search Google, falling back to DuckDuckGo when it returns nothing."""
+    logger.info(f"🔍 Searching: {query}")
+    results = search_google(query, num_results=10, days=days)
+    if not results:
+        logger.info(f"   Google failed, trying DuckDuckGo ({query})...")
+        results = search_web_fallback(query, days=days)
+    return results
+
+
 def search_recent_startups(days: int = 30) -> List[Dict[str, Any]]:
     """Search for startups founded in the last N days with multiple fallback sources."""
     from datetime import datetime, timedelta
 
-    # Calculate date range
     end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
 
     # Get current year and month for dynamic queries
     current_year = end_date.year
     current_month = end_date.strftime('%B')  # e.g., "November"
-    previous_month = (end_date.replace(day=1) - timedelta(days=1)).strftime('%B')
-
-    # Format dates for Google search (YYYY-MM-DD)
-    start_date_str = start_date.strftime('%Y-%m-%d')
-    end_date_str = end_date.strftime('%Y-%m-%d')
+    previous_month_end = end_date.replace(day=1) - timedelta(days=1)
+    previous_month = previous_month_end.strftime('%B')
+    previous_month_year = previous_month_end.year  # differs in January
 
-    # More specific queries with date filters
     queries = [
-        # Recent date-specific queries
-        f"startup founded after:{start_date_str} before:{end_date_str}",
-        f"new startup launch after:{start_date_str} before:{end_date_str}",
-        f"startup announcement after:{start_date_str} before:{end_date_str}",
+        # Recent-launch query; the first entry is restricted to the last
+        # `days` days via the search APIs' date parameters
+        "new startup launch",
 
         # Month-specific queries
         f"startup founded {current_month} {current_year}",
-        f"startup founded {previous_month} {current_year}",
+        f"startup founded {previous_month} {previous_month_year}",
 
         # Category-specific with year
         f"AI startup founded {current_year}",
@@ -219,33 +432,38 @@ def search_recent_startups(days: int = 30) -> List[Dict[str, Any]]:
         f"startup news {current_month} {current_year}",
         f"new company founded {current_month} {current_year}"
     ]
+    query_days = [days] + [None] * (len(queries) - 1)
 
-    all_results = []
-    seen_titles = set()  # Track seen titles to avoid duplicates
+    # Results must mention the current year or a recent month
+    recent_re = re.compile(
+        rf'\b({current_year}|{re.escape(current_month)}|{re.escape(previous_month)})\b',
+        re.IGNORECASE
+    )
 
-    for query in queries:
-        logger.info(f"🔍 Searching: {query}")
-
-        # Try Google first
-        results = search_google(query, num_results=10)
+    all_results = []
+    seen_titles = set()  # 8-byte hashes of normalized titles seen so far
 
-        # If Google fails, use DuckDuckGo fallback
-        if not results:
-            logger.info(f"   Google failed, trying DuckDuckGo...")
-            results = search_web_fallback(query)
+    # Queries are independent and network-bound, so run them concurrently;
+    # map() keeps results in query order for a deterministic merge
+    with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as executor:
+        results_per_query = list(executor.map(_search_with_fallback, queries, query_days))
 
+    for results in results_per_query:
         # Filter out duplicates and old results
+        new = 0
         for result in results:
-            title = result.get('title', '')
-            # Skip if we've seen this title before
-            if title not in seen_titles:
+            title_key = hashlib.blake2b(
+                normalize_startup_name(result.get('title', '')).encode(), digest_size=8
+            ).digest()
+            # Skip if we've seen this title (ignoring case/punctuation) before
+            if title_key not in seen_titles:
                 # Check if result mentions current year or recent months
-                snippet = result.get('snippet', '').lower()
-                if str(current_year) in snippet or current_month.lower() in snippet or previous_month.lower() in snippet:
+                if recent_re.search(result.get('snippet', '')):
                     all_results.append(result)
-                    seen_titles.add(title)
+                    seen_titles.add(title_key)
+                    new += 1
 
-        logger.info(f"   Found {len(results)} results, {len([r for r in results if r.get('title') not in seen_titles])} new")
+        logger.info(f"   Found {len(results)} results, {new} new")
 
     logger.info(f"✅ Total unique results from all queries: {len(all_results)}")
     return all_results
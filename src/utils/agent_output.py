@@ -0,0 +1,194 @@
+"""Parse structured data out of free-form agent output."""
+
+import json
+import logging
+import re
+from typing import Any, List, Optional, Union
+
+import orjson
+
+from ..database.db import startup_name_hash
+
+logger = logging.getLogger(__name__)
+
+# Candidate start positions for a JSON value embedded in agent output
+_JSON_START_RE = re.compile(r'[\[{]')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def extract_json(text: str):
+    """Return the first JSON array/object embedded in text, or None.
+
+    Pure JSON output is parsed with orjson. Otherwise decodes from each
+    '[' / '{' with raw_decode, which handles nested brackets correctly and
+    avoids backtracking over the whole output.
+    """
+    stripped = text.strip()
+    if stripped.startswith(('[', '{')):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+
+    for match in _JSON_START_RE.finditer(text):
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, match.start())
+            return value
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def _as_json(output: Union[str, Any]):
+    """Parse agent output text; already-parsed lists/dicts pass through."""
+    return extract_json(output) if isinstance(output, str) else output
+
+
+# Canonical field -> keys agents have been seen to use for it, in priority order
+_FIELD_ALIASES = {
+    'name': ('name', 'startup_name'),
+    'primary_tier': ('primary_tier', 'tier'),
+    'secondary_tiers': ('secondary_tiers', 'secondary_tier'),
+    'reasoning': ('reasoning', 'reason'),
+    'score': ('india_fit_score', 'score'),
+    'analysis': ('india_fit_analysis', 'analysis'),
+}
+_TIER_FIELDS = ('primary_tier', 'secondary_tiers', 'reasoning')
+_FIT_FIELDS = ('score', 'analysis')
+_STARTUP_LIST_KEYS = ('startups', 'top_opportunities', 'opportunities')
+
+
+def _resolve_fields(item: dict) -> dict:
+    """Map an agent item onto canonical fields using the first non-empty alias."""
+    resolved = {}
+    for field, aliases in _FIELD_ALIASES.items():
+        value = None
+        for key in aliases:
+            value = item.get(key)
+            if value:
+                break
+        resolved[field] = value
+    return resolved
+
+
+def parse_agent_json(output: Union[str, Any]) -> dict:
+    """Decode agent output once and extract startups, tiers and fit scores.
+
+    Accepts a list of startup items, a dict wrapping such a list (under
+    'startups', 'top_opportunities' or 'opportunities'), a single startup
+    dict, or a dict keyed by startup name.
+
+    Returns:
+        Dict with 'startups' (list of item dicts), 'tiers' and 'fits'
+        (startup name -> canonical tier / market fit fields)
+    """
+    parsed = {'startups': [], 'tiers': {}, 'fits': {}}
+    data = _as_json(output)
+
+    if isinstance(data, list):
+        items = data
+    elif isinstance(data, dict):
+        list_key = next((key for key in _STARTUP_LIST_KEYS if key in data), None)
+        if list_key is not None:
+            items = data[list_key] if isinstance(data[list_key], list) else []
+        elif any(key in data for key in _FIELD_ALIASES['name']):
+            items = [data]
+        else:
+            # Mapping of startup name -> details
+            items = [{'name': key, **value} for key, value in data.items() if isinstance(value, dict)]
+    else:
+        logger.warning("Could not parse JSON from agent output")
+        return parsed
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        parsed['startups'].append(item)
+
+        fields = _resolve_fields(item)
+        name = fields['name']
+        if any(fields[field] for field in _TIER_FIELDS):
+            parsed['tiers'][name] = {field: fields[field] for field in _TIER_FIELDS}
+        if any(fields[field] for field in _FIT_FIELDS):
+            parsed['fits'][name] = {field: fields[field] for field in _FIT_FIELDS}
+
+    return parsed
+
+
+def analysis_record(output: Optional[str], kind: str, name: str) -> Optional[dict]:
+    """Fit or tier fields from one startup's own analysis output.
+
+    The output belongs to the startup by position, so its record is used
+    even when the model echoes the name differently ("Acme Inc." vs
+    "Acme, Inc."); an exact name match wins if it lists several.
+
+    Args:
+        output: Agent output for this startup, or None if the analysis failed
+        kind: 'fits' or 'tiers'
+        name: Startup name from discovery
+
+    Returns:
+        Canonical fit/tier fields, or None if the output has none
+    """
+    if output is None:
+        return None
+    records = parse_agent_json(output)[kind]
+    if not records:
+        return None
+    return records.get(name) or next(iter(records.values()))
+
+
+def merge_results(startups: list, fit_outputs: List[Optional[str]],
+                  tier_outputs: List[Optional[str]]) -> List[dict]:
+    """Merge discovery, market fit and tier outputs into database records.
+
+    fit_outputs and tier_outputs are index-aligned with startups, so each
+    analysis is attached to its startup by position rather than by the
+    name the model echoed back. Startups past the end of a shorter output
+    list are kept, just without that analysis.
+
+    Returns:
+        One database record per named startup, in discovery order
+    """
+    records = []
+    for index, startup in enumerate(startups):
+        fit_output = fit_outputs[index] if index < len(fit_outputs) else None
+        tier_output = tier_outputs[index] if index < len(tier_outputs) else None
+        name = startup.get('name') or startup.get('startup_name')
+        if not name:
+            continue
+        tier = analysis_record(tier_output, 'tiers', name)
+        fit = analysis_record(fit_output, 'fits', name)
+
+        # Merge tier and fit info
+        startup_data = {
+            'name': name,
+            'website': startup.get('website') or startup.get('url'),
+            'description': startup.get('description'),
+            'category': startup.get('category'),
+            'founded_date': startup.get('founded_date') or startup.get('date'),
+            'country': startup.get('country'),
+            'source': startup.get('source'),
+            'source_url': startup.get('source_url'),
+            'hash': startup_name_hash(name)
+        }
+
+        # Add tier info - this startup's tier analysis, else the startup dict
+        if tier is not None:
+            startup_data['primary_tier'] = tier.get('primary_tier')
+            startup_data['secondary_tiers'] = tier.get('secondary_tiers')
+        elif 'primary_tier' in startup:
+            startup_data['primary_tier'] = startup.get('primary_tier')
+            startup_data['secondary_tiers'] = startup.get('secondary_tiers')
+
+        # Add market fit info - this startup's fit analysis, else the startup dict
+        if fit is not None:
+            startup_data['india_fit_score'] = fit.get('score', 0)
+            startup_data['india_fit_analysis'] = fit.get('analysis')
+        elif 'india_fit_score' in startup:
+            startup_data['india_fit_score'] = startup.get('india_fit_score', 0)
+            startup_data['india_fit_analysis'] = startup.get('india_fit_analysis')
+
+        records.append(startup_data)
+
+    return records
@@ -1,22 +1,70 @@
 """Track and log agent execution details."""
 
-import json
 import logging
+import reprlib
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from .json_utils import dumps
 
 logger = logging.getLogger(__name__)
 
+EVENT_LOG_BUFFER_SIZE = 1 << 16
+
+# Bounded repr for containers: walks only as much of a large list/dict as
+# it will show
+_REPR = reprlib.Repr()
+_REPR.maxstring = 500
+_REPR.maxlist = _REPR.maxtuple = _REPR.maxdict = _REPR.maxset = 10
+
+_CONTAINER_TYPES = (list, tuple, dict, set, frozenset)
+
+
+def _truncate(value: Any, limit: int) -> str:
+    """Short text preview of value.
+
+    Built-in containers use a bounded repr so large ones are not
+    stringified in full; anything else keeps its str() form.
+    """
+    if type(value) in _CONTAINER_TYPES:
+        return _REPR.repr(value)[:limit]
+    return str(value)[:limit]
+
 
 class AgentTracker:
-    """Track agent inputs, outputs, and tool usage."""
+    """Track agent inputs, outputs, and tool usage.
+    
+    Times are recorded as monotonic nanosecond offsets from tracker creation
+    (``start_ns``, ``end_ns``, ``t_ns``) and only turned into ISO timestamps
+    when reports are saved.
+    """
     
     def __init__(self, run_id: str):
         self.run_id = run_id
         self.agents_data = {}
         self.output_dir = Path(__file__).parent.parent.parent / "reports" / f"run_{run_id}"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_ready = False
+        self._events: Optional[BinaryIO] = None
+        self._t0 = time.time()
+        self._base_ns = time.monotonic_ns()
+        
+    def _elapsed_ns(self) -> int:
+        """Monotonic nanoseconds since the tracker was created."""
+        return time.monotonic_ns() - self._base_ns
+        
+    def _iso(self, offset_ns: Optional[int]) -> Optional[str]:
+        """Convert an elapsed-time offset to an ISO timestamp."""
+        if offset_ns is None:
+            return None
+        return datetime.fromtimestamp(self._t0 + offset_ns / 1e9).isoformat()
+        
+    def _ensure_output_dir(self):
+        """Create the report directory on first write."""
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
         
     def start_agent(self, agent_name: str, task_description: str, input_data: Dict[str, Any] = None):
         """Record agent start."""
@@ -26,8 +74,8 @@ class AgentTracker:
             "input": input_data or {},
             "tools_used": [],
             "output": None,
-            "start_time": datetime.now().isoformat(),
-            "end_time": None,
+            "start_ns": self._elapsed_ns(),
+            "end_ns": None,
             "status": "running"
         }
         logger.info(f"🤖 Agent Started: {agent_name}")
@@ -41,12 +89,26 @@ class AgentTracker:
         tool_record = {
             "tool_name": tool_name,
             "input": tool_input,
-            "output": str(tool_output)[:500],  # Truncate long outputs
-            "timestamp": datetime.now().isoformat()
+            "output": _truncate(tool_output, 500),  # Truncate long outputs
+            "t_ns": self._elapsed_ns()
         }
         self.agents_data[agent_name]["tools_used"].append(tool_record)
+        self._write_event({"agent": agent_name, **tool_record})
         logger.info(f"🔧 Tool Used: {tool_name} by {agent_name}")
         
+    def _write_event(self, record: Dict[str, Any]):
+        """Append one compact JSON line to the buffered events.jsonl log."""
+        if self._events is None:
+            self._ensure_output_dir()
+            self._events = (self.output_dir / "events.jsonl").open("ab", buffering=EVENT_LOG_BUFFER_SIZE)
+        self._events.write(dumps(record) + b"\n")
+        
+    def close(self):
+        """Flush and close the event log."""
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        
     def end_agent(self, agent_name: str, output: Any, status: str = "completed"):
         """Record agent completion."""
         if agent_name not in self.agents_data:
@@ -54,41 +116,59 @@ class AgentTracker:
             return
             
         self.agents_data[agent_name]["output"] = output
-        self.agents_data[agent_name]["end_time"] = datetime.now().isoformat()
+        self.agents_data[agent_name]["end_ns"] = self._elapsed_ns()
         self.agents_data[agent_name]["status"] = status
         logger.info(f"✅ Agent Completed: {agent_name} (Status: {status})")
         
+    def _report_view(self, agent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent data with elapsed-time offsets rendered as ISO timestamps."""
+        view = {k: v for k, v in agent_data.items() if k not in ("start_ns", "end_ns", "tools_used")}
+        view["start_time"] = self._iso(agent_data["start_ns"])
+        view["end_time"] = self._iso(agent_data["end_ns"])
+        view["tools_used"] = [
+            {**{k: v for k, v in tool.items() if k != "t_ns"}, "timestamp": self._iso(tool["t_ns"])}
+            for tool in agent_data["tools_used"]
+        ]
+        return view
+        
     def save_agent_report(self, agent_name: str):
         """Save individual agent report."""
         if agent_name not in self.agents_data:
             logger.warning(f"Agent {agent_name} not found in tracker")
             return
             
-        agent_data = self.agents_data[agent_name]
+        self._ensure_output_dir()
         report_path = self.output_dir / f"{agent_name}_report.json"
         
-        with open(report_path, 'w') as f:
-            json.dump(agent_data, f, indent=2, default=str)
+        report_path.write_bytes(dumps(self._report_view(self.agents_data[agent_name]), indent=True))
         
         logger.info(f"📄 Agent Report Saved: {report_path}")
         
-    def save_all_reports(self):
-        """Save all agent reports."""
-        for agent_name in self.agents_data:
-            self.save_agent_report(agent_name)
+    def save_all_reports(self, per_agent: bool = False):
+        """Save the agents summary report and flush the event log.
+        
+        Args:
+            per_agent: Also write one report file per agent (the summary
+                already contains every agent's data)
+        """
+        self.close()
+        if per_agent:
+            for agent_name in self.agents_data:
+                self.save_agent_report(agent_name)
             
         # Save summary
+        self._ensure_output_dir()
         summary_path = self.output_dir / "agents_summary.json"
         summary = {
             "run_id": self.run_id,
             "timestamp": datetime.now().isoformat(),
             "agents": list(self.agents_data.keys()),
             "total_agents": len(self.agents_data),
-            "agents_data": self.agents_data
+            "started_at": self._iso(0),
+            "agents_data": {name: self._report_view(data) for name, data in self.agents_data.items()}
         }
         
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        summary_path.write_bytes(dumps(summary, indent=True))
         
         logger.info(f"📊 Summary Report Saved: {summary_path}")
         
@@ -110,7 +190,7 @@ class AgentTracker:
                 print(f"         Output: {tool['output'][:100]}...")
                 
             if data['output']:
-                output_str = str(data['output'])[:200]
+                output_str = _truncate(data['output'], 200)
                 print(f"   Output: {output_str}...")
                 
         print("\n" + "="*80 + "\n")
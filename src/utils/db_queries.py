@@ -21,10 +21,20 @@ class DatabaseQueries:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
     
-    def _get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the database connection, opened once and reused across queries."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+    
+    def close(self):
+        """Close the cached connection (reopened on next query)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def get_all_startups(self) -> List[Dict[str, Any]]:
         """Get all startups from database.
@@ -33,15 +43,12 @@ class DatabaseQueries:
             List of startup dictionaries
         """
         try:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
             
             cursor.execute("SELECT * FROM startups ORDER BY created_at DESC")
             rows = cursor.fetchall()
             
             startups = [dict(row) for row in rows]
-            conn.close()
             
             logger.info(f"✅ Retrieved {len(startups)} startups from database")
             return startups
@@ -59,9 +66,7 @@ class DatabaseQueries:
             List of startup dictionaries
         """
         try:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
             
             cursor.execute(
                 "SELECT * FROM startups WHERE primary_tier = ? ORDER BY india_fit_score DESC",
@@ -70,7 +75,6 @@ class DatabaseQueries:
             rows = cursor.fetchall()
             
             startups = [dict(row) for row in rows]
-            conn.close()
             
             logger.info(f"✅ Retrieved {len(startups)} startups for {tier}")
             return startups
@@ -88,9 +92,7 @@ class DatabaseQueries:
             List of startup dictionaries
         """
         try:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
             
             cursor.execute(
                 "SELECT * FROM startups ORDER BY india_fit_score DESC LIMIT ?",
@@ -99,7 +101,6 @@ class DatabaseQueries:
             rows = cursor.fetchall()
             
             startups = [dict(row) for row in rows]
-            conn.close()
             
             logger.info(f"✅ Retrieved top {len(startups)} startups")
             return startups
@@ -110,25 +111,44 @@ class DatabaseQueries:
     def get_startups_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get startups by category.
         
+        Matches any category containing the term, case-insensitively
+        ("tech" finds "FinTech" and "EdTech").
+        
         Args:
-            category: Category name
+            category: Category name or substring
             
         Returns:
             List of startup dictionaries
         """
         try:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
             
-            cursor.execute(
+            like_query = (
                 "SELECT * FROM startups WHERE category LIKE ? ORDER BY india_fit_score DESC",
                 (f"%{category}%",)
             )
+            if len(category) < 3:
+                # Trigram index cannot match terms shorter than three characters
+                cursor.execute(*like_query)
+            else:
+                # Substring match on category via the trigram FTS5 index
+                match = 'category : "{}"'.format(category.replace('"', '""'))
+                try:
+                    cursor.execute(
+                        """
+                        SELECT s.* FROM startups s
+                        JOIN startups_fts f ON s.id = f.rowid
+                        WHERE startups_fts MATCH ?
+                        ORDER BY s.india_fit_score DESC
+                        """,
+                        (match,)
+                    )
+                except sqlite3.OperationalError:
+                    # Database without the FTS index
+                    cursor.execute(*like_query)
             rows = cursor.fetchall()
             
             startups = [dict(row) for row in rows]
-            conn.close()
             
             logger.info(f"✅ Retrieved {len(startups)} startups in category: {category}")
             return startups
@@ -143,30 +163,32 @@ class DatabaseQueries:
             Dictionary with statistics
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Total startups
-            cursor.execute("SELECT COUNT(*) FROM startups")
-            total = cursor.fetchone()[0]
-            
-            # By tier
-            cursor.execute("SELECT primary_tier, COUNT(*) FROM startups GROUP BY primary_tier")
-            tier_counts = dict(cursor.fetchall())
-            
-            # By category
-            cursor.execute("SELECT category, COUNT(*) FROM startups GROUP BY category")
-            category_counts = dict(cursor.fetchall())
-            
-            # Average India fit score
-            cursor.execute("SELECT AVG(india_fit_score) FROM startups")
-            avg_score = cursor.fetchone()[0] or 0
-            
-            # By country
-            cursor.execute("SELECT country, COUNT(*) FROM startups GROUP BY country ORDER BY COUNT(*) DESC LIMIT 10")
-            top_countries = dict(cursor.fetchall())
-            
-            conn.close()
+            # One round trip: each branch tags its rows with the statistic it feeds
+            cursor = self._get_connection().execute("""
+                SELECT 'total', NULL, COUNT(*) FROM startups
+                UNION ALL
+                SELECT 'avg_score', NULL, AVG(india_fit_score) FROM startups
+                UNION ALL
+                SELECT 'tier', primary_tier, COUNT(*) FROM startups GROUP BY primary_tier
+                UNION ALL
+                SELECT 'category', category, COUNT(*) FROM startups GROUP BY category
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 'country', country, COUNT(*) FROM startups
+                    GROUP BY country ORDER BY COUNT(*) DESC LIMIT 10
+                )
+            """)
+            
+            total, avg_score = 0, 0
+            tier_counts, category_counts, top_countries = {}, {}, {}
+            groups = {"tier": tier_counts, "category": category_counts, "country": top_countries}
+            for kind, key, value in cursor.fetchall():
+                if kind == "total":
+                    total = value
+                elif kind == "avg_score":
+                    avg_score = value or 0
+                else:
+                    groups[kind][key] = value
             
             stats = {
                 "total_startups": total,
@@ -0,0 +1,24 @@
+"""Fast JSON serialization helpers."""
+
+from typing import Any
+
+import orjson
+
+_BASE_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes with orjson.
+
+    Dataclasses, datetimes and other types orjson supports natively are
+    serialized directly; anything else falls back to str().
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    option = _BASE_OPTIONS | orjson.OPT_INDENT_2 if indent else _BASE_OPTIONS
+    return orjson.dumps(obj, default=str, option=option)
@@ -1,12 +1,13 @@
 """Output management and file generation utilities."""
 
-import json
 import logging
 import csv
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from .json_utils import dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,11 +48,9 @@ class OutputManager:
         
         try:
             if format == "json":
-                with open(filepath, 'w') as f:
-                    if isinstance(output, str):
-                        json.dump({"output": output}, f, indent=2)
-                    else:
-                        json.dump(output, f, indent=2, default=str)
+                if isinstance(output, str):
+                    output = {"output": output}
+                filepath.write_bytes(dumps(output, indent=True))
             else:  # txt format
                 with open(filepath, 'w') as f:
                     f.write(str(output))
@@ -125,8 +124,7 @@ class OutputManager:
         filepath = self.run_dir / "final_report.json"
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            filepath.write_bytes(dumps(report, indent=True))
             
             logger.info(f"✅ Saved final report to: {filepath}")
             return filepath
@@ -151,16 +149,13 @@ class OutputManager:
                 logger.warning("No startups to export")
                 return None
             
-            # Get all unique keys
-            fieldnames = set()
-            for startup in startups:
-                fieldnames.update(startup.keys())
-            fieldnames = sorted(list(fieldnames))
+            # All unique keys, sorted so the column layout is stable
+            fieldnames = sorted({key for startup in startups for key in startup})
             
             with open(filepath, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(startups)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows([startup.get(key, "") for key in fieldnames] for startup in startups)
             
             logger.info(f"✅ Saved CSV export to: {filepath}")
             return filepath
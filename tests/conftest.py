@@ -0,0 +1,46 @@
+"""Shared pytest configuration and fixtures."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Point the database layer at a private in-memory SQLite database before any
+# src module is imported; the shared connection keeps it alive for the session
+os.environ["DB_PATH"] = ":memory:"
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Create the schema once and share one connection across the session."""
+    from src.database.db import init_database, close_db_connection
+
+    init_database()
+    yield
+    close_db_connection()
+
+
+@pytest.fixture
+def clean_db(database):
+    """Start a test from an empty database."""
+    from src.database.db import get_db_connection
+
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM startups")
+        conn.execute("DELETE FROM run_metadata")
+        conn.commit()
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """Point the database layer at a fresh on-disk database for one test."""
+    from src.database import db
+
+    db_path = tmp_path / "startups.db"
+    monkeypatch.setattr(db, "DB_PATH", db_path)
+    monkeypatch.setattr(db, "_connection", None)
+    yield db_path
+    db.close_db_connection()
@@ -1,199 +1,251 @@
 """Tests for database functions."""
 
+import shutil
 import sys
-import unittest
-import tempfile
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.db import (
     init_database,
+    get_db_connection,
     insert_startup,
+    insert_startups_bulk,
     get_all_startups,
+    get_all_startups_columnar,
     get_startups_by_tier,
+    get_tier_counts,
+    iter_startups,
     insert_run_metadata,
-    get_latest_run
+    get_latest_run,
+    startup_name_hash,
+    normalize_startup_name
 )
 
+pytestmark = pytest.mark.usefixtures("clean_db")
+
+
+def make_startup(name: str, **overrides) -> dict:
+    """Build a complete startup record for insert tests."""
+    startup = {
+        'name': name,
+        'website': f'https://{name.lower()}.com',
+        'description': f'{name} description',
+        'category': 'Tech',
+        'founded_date': '2024-11-01',
+        'country': 'USA',
+        'india_fit_score': 75,
+        'india_fit_analysis': 'Good fit',
+        'primary_tier': 'Tier 1',
+        'secondary_tiers': 'Tier 2',
+        'source': 'Google',
+        'source_url': 'https://google.com',
+        'hash': f'{name.lower()}_hash'
+    }
+    startup.update(overrides)
+    return startup
+
+
+def make_run(run_id: str, **overrides) -> dict:
+    """Build a run metadata record."""
+    run = {
+        'run_id': run_id,
+        'total_startups_found': 10,
+        'tier_1_count': 3,
+        'tier_2_count': 4,
+        'tier_3_count': 3,
+        'processing_time_seconds': 45.5,
+        'status': 'completed',
+        'report_path': f'/reports/{run_id}.json'
+    }
+    run.update(overrides)
+    return run
+
+
+@pytest.mark.parametrize("startup", [
+    make_startup('TestStartup1'),
+    make_startup('TestStartup2', india_fit_score=80, india_fit_analysis='Excellent fit'),
+    make_startup('Tier1Startup', india_fit_score=85, secondary_tiers=None),
+    make_startup('ListStartup', secondary_tiers=['Tier 2', 'Tier 3']),
+])
+def test_insert_startup(startup):
+    """Test successful insertion, then rejection of the same startup."""
+    assert insert_startup(startup)
+    assert not insert_startup(startup)
+
+
+def test_insert_startups_bulk():
+    """Test bulk startup insertion skips duplicates."""
+    startups = [
+        {'name': 'BulkStartup1', 'category': 'Tech', 'hash': 'bulk_hash_1'},
+        {'name': 'BulkStartup2', 'category': 'AI', 'hash': 'bulk_hash_2',
+         'secondary_tiers': ['Tier 2', 'Tier 3']},
+        {'name': 'BulkStartup1', 'category': 'Tech', 'hash': 'bulk_hash_1'},
+    ]
+
+    assert insert_startups_bulk(startups) == 2
+
+    # Re-inserting the same batch inserts nothing
+    assert insert_startups_bulk(startups) == 0
+
+
+def test_startup_name_hash():
+    """Test name hash is stable and ignores case/punctuation."""
+    assert startup_name_hash("Acme, Inc.") == startup_name_hash("acme inc")
+    assert startup_name_hash("Acme") != startup_name_hash("Apex")
+    assert len(startup_name_hash("Acme")) == 32
+
+
+def test_normalize_startup_name_non_latin():
+    """Test names without ASCII letters/digits keep distinct keys."""
+    assert normalize_startup_name("字节跳动 Inc.") == "字节跳动inc"
+    assert normalize_startup_name("Яндекс") == "яндекс"
+    assert normalize_startup_name("😀") == "😀"
+    assert startup_name_hash("字节跳动") != startup_name_hash("😀")
+
+
+def test_insert_startups_bulk_non_latin_names():
+    """Test non-Latin names are not dropped as hash duplicates."""
+    names = ['字节跳动', '😀', 'Яндекс', 'AsciiStartup']
+    assert insert_startups_bulk([{'name': name} for name in names]) == 4
+    assert sorted(s['name'] for s in get_all_startups()) == sorted(names)
+
+
+def test_get_all_startups():
+    """Test retrieving all startups."""
+    insert_startups_bulk([{'name': 'ListedStartup', 'hash': 'listed_hash'}])
+    startups = get_all_startups()
+    assert isinstance(startups, list)
+    assert len(startups) == 1
+
+
+def test_iter_startups():
+    """Test streaming startups matches the list helpers."""
+    insert_startups_bulk([
+        {'name': 'StreamStartup1', 'primary_tier': 'Tier 1'},
+        {'name': 'StreamStartup2', 'primary_tier': 'Tier 2'},
+    ])
+    streamed = iter_startups()
+    assert isinstance(next(streamed), dict)
+    streamed.close()
+    assert sum(1 for _ in iter_startups()) == len(get_all_startups())
+    assert sum(1 for _ in iter_startups('Tier 1')) == len(get_startups_by_tier('Tier 1'))
+
+
+def test_get_startups_by_tier():
+    """Test retrieving startups by tier."""
+    insert_startup(make_startup('Tier1Startup', india_fit_score=85))
+    insert_startup(make_startup('Tier2Startup', primary_tier='Tier 2'))
+
+    tier1_startups = get_startups_by_tier('Tier 1')
+    assert [s['name'] for s in tier1_startups] == ['Tier1Startup']
 
-class TestDatabaseOperations(unittest.TestCase):
-    """Test database operations."""
-    
-    @classmethod
-    def setUpClass(cls):
-        """Set up test database."""
+
+def test_get_tier_counts():
+    """Test tier counts match per-tier queries."""
+    insert_startups_bulk([
+        {'name': 'CountStartup1', 'primary_tier': 'Tier 1'},
+        {'name': 'CountStartup2', 'primary_tier': 'Tier 3'},
+        {'name': 'CountStartup3', 'primary_tier': None},
+    ])
+    counts = get_tier_counts()
+    assert isinstance(counts, dict)
+    for tier in ['Tier 1', 'Tier 2', 'Tier 3']:
+        assert counts.get(tier, 0) == len(get_startups_by_tier(tier))
+    assert sum(counts.values()) == len(get_all_startups())
+
+
+def test_insert_run_metadata():
+    """Test inserting run metadata."""
+    assert insert_run_metadata(make_run('test_run_001'))
+
+
+def test_get_latest_run():
+    """Test retrieving latest run metadata."""
+    insert_run_metadata(make_run('test_run_002', total_startups_found=15, processing_time_seconds=60.0))
+
+    latest_run = get_latest_run()
+    assert latest_run is not None
+    assert latest_run['run_id'] == 'test_run_002'
+
+
+def test_startup_data_integrity():
+    """Test that startup data is stored and retrieved correctly."""
+    insert_startup(make_startup(
+        'IntegrityTest',
+        website='https://integrity.com',
+        category='AI',
+        country='India',
+        india_fit_score=90,
+        source='Product Hunt'
+    ))
+
+    stored = {s['name']: s for s in get_all_startups()}
+    assert 'IntegrityTest' in stored
+    assert stored['IntegrityTest']['website'] == 'https://integrity.com'
+    assert stored['IntegrityTest']['india_fit_score'] == 90
+    assert stored['IntegrityTest']['primary_tier'] == 'Tier 1'
+
+
+def test_get_all_startups_columnar():
+    """Test columnar startups line up with the row-based helper."""
+    assert get_all_startups_columnar()['name'] == []
+
+    insert_startup(make_startup('IntegrityTest', india_fit_score=90))
+    insert_startup(make_startup('OtherTest', india_fit_score=40))
+
+    columns = get_all_startups_columnar()
+    assert columns['name'] == [s['name'] for s in get_all_startups()]
+    idx = columns['name'].index('IntegrityTest')
+    assert columns['india_fit_score'][idx] == 90
+    assert columns['primary_tier'][idx] == 'Tier 1'
+
+
+def test_init_database_backfills_hashes(caplog):
+    """Test legacy NULL hashes are backfilled and only real updates are logged."""
+    insert_startups_bulk([{'name': 'Acme'}])
+    with get_db_connection() as conn:
+        conn.executemany(
+            "INSERT INTO startups (name, hash) VALUES (?, NULL)",
+            [('Legacy Co',), ('ACME',)]  # 'ACME' collides with Acme's hash
+        )
+        conn.commit()
+
+    with caplog.at_level('INFO', logger='src.database.db'):
         init_database()
-        print("✅ Test database initialized")
-    
-    def test_insert_startup_success(self):
-        """Test successful startup insertion."""
-        startup_data = {
-            'name': 'TestStartup1',
-            'website': 'https://test1.com',
-            'description': 'Test startup 1',
-            'category': 'Tech',
-            'founded_date': '2024-11-01',
-            'country': 'USA',
-            'india_fit_score': 75,
-            'india_fit_analysis': 'Good fit',
-            'primary_tier': 'Tier 1',
-            'secondary_tiers': 'Tier 2',
-            'source': 'Google',
-            'source_url': 'https://google.com',
-            'hash': 'test_hash_1'
-        }
-        
-        result = insert_startup(startup_data)
-        self.assertTrue(result)
-        print("✅ test_insert_startup_success passed")
-    
-    def test_insert_duplicate_startup(self):
-        """Test duplicate startup insertion."""
-        startup_data = {
-            'name': 'TestStartup2',
-            'website': 'https://test2.com',
-            'description': 'Test startup 2',
-            'category': 'Tech',
-            'founded_date': '2024-11-01',
-            'country': 'USA',
-            'india_fit_score': 80,
-            'india_fit_analysis': 'Excellent fit',
-            'primary_tier': 'Tier 1',
-            'secondary_tiers': 'Tier 2',
-            'source': 'Google',
-            'source_url': 'https://google.com',
-            'hash': 'test_hash_2'
-        }
-        
-        # First insert should succeed
-        result1 = insert_startup(startup_data)
-        self.assertTrue(result1)
-        
-        # Duplicate insert should fail
-        result2 = insert_startup(startup_data)
-        self.assertFalse(result2)
-        print("✅ test_insert_duplicate_startup passed")
-    
-    def test_get_all_startups(self):
-        """Test retrieving all startups."""
-        startups = get_all_startups()
-        self.assertIsInstance(startups, list)
-        self.assertGreater(len(startups), 0)
-        print(f"✅ test_get_all_startups passed (found {len(startups)} startups)")
-    
-    def test_get_startups_by_tier(self):
-        """Test retrieving startups by tier."""
-        # Insert a Tier 1 startup
-        startup_data = {
-            'name': 'Tier1Startup',
-            'website': 'https://tier1.com',
-            'description': 'Tier 1 startup',
-            'category': 'Tech',
-            'founded_date': '2024-11-01',
-            'country': 'USA',
-            'india_fit_score': 85,
-            'india_fit_analysis': 'Excellent',
-            'primary_tier': 'Tier 1',
-            'secondary_tiers': None,
-            'source': 'Google',
-            'source_url': 'https://google.com',
-            'hash': 'tier1_hash'
-        }
-        
-        insert_startup(startup_data)
-        
-        # Retrieve Tier 1 startups
-        tier1_startups = get_startups_by_tier('Tier 1')
-        self.assertIsInstance(tier1_startups, list)
-        self.assertGreater(len(tier1_startups), 0)
-        print(f"✅ test_get_startups_by_tier passed (found {len(tier1_startups)} Tier 1 startups)")
-    
-    def test_insert_run_metadata(self):
-        """Test inserting run metadata."""
-        run_data = {
-            'run_id': 'test_run_001',
-            'total_startups_found': 10,
-            'tier_1_count': 3,
-            'tier_2_count': 4,
-            'tier_3_count': 3,
-            'processing_time_seconds': 45.5,
-            'status': 'completed',
-            'report_path': '/reports/test_run_001.json'
-        }
-        
-        result = insert_run_metadata(run_data)
-        self.assertTrue(result)
-        print("✅ test_insert_run_metadata passed")
-    
-    def test_get_latest_run(self):
-        """Test retrieving latest run metadata."""
-        # Insert a run first
-        run_data = {
-            'run_id': 'test_run_002',
-            'total_startups_found': 15,
-            'tier_1_count': 5,
-            'tier_2_count': 5,
-            'tier_3_count': 5,
-            'processing_time_seconds': 60.0,
-            'status': 'completed',
-            'report_path': '/reports/test_run_002.json'
-        }
-        
-        insert_run_metadata(run_data)
-        
-        # Retrieve latest run
-        latest_run = get_latest_run()
-        self.assertIsNotNone(latest_run)
-        self.assertEqual(latest_run['run_id'], 'test_run_002')
-        print("✅ test_get_latest_run passed")
-
-
-class TestDatabaseIntegrity(unittest.TestCase):
-    """Test database integrity."""
-    
-    @classmethod
-    def setUpClass(cls):
-        """Set up test database."""
         init_database()
-    
-    def test_startup_data_integrity(self):
-        """Test that startup data is stored and retrieved correctly."""
-        startup_data = {
-            'name': 'IntegrityTest',
-            'website': 'https://integrity.com',
-            'description': 'Integrity test startup',
-            'category': 'AI',
-            'founded_date': '2024-11-01',
-            'country': 'India',
-            'india_fit_score': 90,
-            'india_fit_analysis': 'Perfect fit',
-            'primary_tier': 'Tier 1',
-            'secondary_tiers': 'Tier 2',
-            'source': 'Product Hunt',
-            'source_url': 'https://producthunt.com',
-            'hash': 'integrity_hash'
-        }
-        
-        # Insert
-        insert_startup(startup_data)
-        
-        # Retrieve
-        all_startups = get_all_startups()
-        found = False
-        for startup in all_startups:
-            if startup['name'] == 'IntegrityTest':
-                found = True
-                self.assertEqual(startup['website'], 'https://integrity.com')
-                self.assertEqual(startup['india_fit_score'], 90)
-                self.assertEqual(startup['primary_tier'], 'Tier 1')
-                break
-        
-        self.assertTrue(found)
-        print("✅ test_startup_data_integrity passed")
-
-
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
 
+    backfills = [r.getMessage() for r in caplog.records if 'Backfilled' in r.getMessage()]
+    assert backfills == ['✅ Backfilled hashes for 1 startups']
+    hashes = {s['name']: s['hash'] for s in get_all_startups()}
+    assert hashes['Legacy Co'] == startup_name_hash('Legacy Co')
+    assert hashes['ACME'] is None
+
+
+def test_init_database_rehashes_legacy_integer_hashes():
+    """Test salted built-in hash() values are replaced so dedup works across runs."""
+    with get_db_connection() as conn:
+        conn.execute(
+            "INSERT INTO startups (name, hash) VALUES ('EduNext', '8085923744868648253')"
+        )
+        conn.commit()
+
+    init_database()
+
+    assert get_all_startups()[0]['hash'] == startup_name_hash('EduNext')
+    assert not insert_startup(make_startup('EduNext.', hash=None))
+
+
+def test_init_database_migrates_existing_database(file_db):
+    """Test a database written by earlier runs is rehashed for cross-run dedup."""
+    shutil.copy(Path(__file__).parent.parent / "startup_research.db", file_db)
+
+    init_database()
+
+    startups = get_all_startups()
+    assert startups
+    assert all(s['hash'] == startup_name_hash(s['name']) for s in startups)
+    assert not insert_startup(make_startup('EduNext.', hash=None))
@@ -0,0 +1,67 @@
+"""Tests for DatabaseQueries."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import db
+from src.utils.db_queries import DatabaseQueries
+
+
+def seed_categories():
+    """Insert startups across overlapping categories."""
+    db.insert_startups_bulk([
+        {'name': 'PayCo', 'category': 'FinTech', 'india_fit_score': 80},
+        {'name': 'LearnCo', 'category': 'EdTech', 'india_fit_score': 60},
+        {'name': 'ChipCo', 'category': 'Tech', 'india_fit_score': 70},
+        {'name': 'BotCo', 'category': 'AI', 'india_fit_score': 90},
+    ])
+
+
+@pytest.mark.parametrize("category, expected", [
+    ('tech', ['PayCo', 'ChipCo', 'LearnCo']),  # substring, any case
+    ('Tech', ['PayCo', 'ChipCo', 'LearnCo']),
+    ('fintech', ['PayCo']),
+    ('AI', ['BotCo']),                         # shorter than a trigram
+    ('Health', []),
+])
+def test_get_startups_by_category(file_db, category, expected):
+    """Test category lookups keep substring semantics."""
+    db.init_database()
+    seed_categories()
+
+    queries = DatabaseQueries(file_db)
+    try:
+        assert [s['name'] for s in queries.get_startups_by_category(category)] == expected
+    finally:
+        queries.close()
+
+
+def test_init_database_rebuilds_word_tokenized_fts(file_db):
+    """Test an FTS table from the earlier word tokenizer is migrated."""
+    db.init_database()
+    db.close_db_connection()
+    conn = sqlite3.connect(file_db)
+    conn.executescript("""
+        DROP TRIGGER startups_fts_ai;
+        DROP TRIGGER startups_fts_ad;
+        DROP TRIGGER startups_fts_au;
+        DROP TABLE startups_fts;
+        CREATE VIRTUAL TABLE startups_fts
+        USING fts5(name, category, content='startups', content_rowid='id');
+        INSERT INTO startups (name, category) VALUES ('OldCo', 'FinTech');
+    """)
+    conn.close()
+
+    db.init_database()
+
+    queries = DatabaseQueries(file_db)
+    try:
+        assert [s['name'] for s in queries.get_startups_by_category('tech')] == ['OldCo']
+    finally:
+        queries.close()
@@ -0,0 +1,149 @@
+"""Tests for email notification tools."""
+
+import asyncio
+import base64
+import gzip
+import io
+import os
+import smtplib
+import sys
+from email.mime.multipart import MIMEMultipart
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.email_tools import ATTACHMENT_CHUNK_SIZE, EmailNotifier
+
+
+@pytest.fixture
+def smtp_servers():
+    """Patch smtplib.SMTP; yields the mock servers in connection order."""
+    servers = []
+
+    def connect(*args, **kwargs):
+        server = mock.MagicMock()
+        server.__enter__.return_value = server
+        servers.append(server)
+        return server
+
+    with mock.patch("smtplib.SMTP", side_effect=connect):
+        yield servers
+
+
+def make_notifier() -> EmailNotifier:
+    """Notifier with credentials, so sends are attempted."""
+    return EmailNotifier(sender_email="sender@example.com", sender_password="secret")
+
+
+def report_email(report_dir: Path, run_id: str = "run_1") -> dict:
+    """send_report_email arguments for a run with one report file."""
+    (report_dir / "agents_summary.json").write_text('{"agents": []}')
+    return {
+        "recipient_emails": ["a@example.com", "b@example.com"],
+        "run_id": run_id,
+        "report_dir": report_dir,
+        "startup_count": 3,
+        "tier_breakdown": {"Tier 1": 1, "Tier 2": 2},
+    }
+
+
+def test_context_manager_logs_in_once_for_many_sends(smtp_servers, tmp_path):
+    """Test sends inside a with block share one authenticated connection."""
+    with make_notifier() as notifier:
+        for i in range(3):
+            assert notifier.send_report_email(**report_email(tmp_path, f"run_{i}"))
+
+    assert len(smtp_servers) == 1
+    server = smtp_servers[0]
+    server.login.assert_called_once_with("sender@example.com", "secret")
+    assert server.sendmail.call_count == 3
+    server.quit.assert_called_once()
+
+
+def test_reconnects_and_closes_stale_connection_after_noop_failure(smtp_servers, tmp_path):
+    """Test a dropped connection is closed and replaced before sending."""
+    with make_notifier() as notifier:
+        smtp_servers[0].noop.side_effect = smtplib.SMTPServerDisconnected()
+        assert notifier.send_report_email(**report_email(tmp_path))
+
+    stale, fresh = smtp_servers
+    stale.close.assert_called_once()
+    stale.sendmail.assert_not_called()
+    fresh.login.assert_called_once()
+    fresh.sendmail.assert_called_once()
+
+
+def test_send_report_emails_async_shares_one_connection(smtp_servers, tmp_path):
+    """Test concurrent sends open a single connection and close it afterwards."""
+    notifier = make_notifier()
+    emails = [report_email(tmp_path, f"run_{i}") for i in range(3)]
+
+    assert asyncio.run(notifier.send_report_emails_async(emails)) == [True, True, True]
+
+    assert len(smtp_servers) == 1
+    smtp_servers[0].login.assert_called_once()
+    assert smtp_servers[0].sendmail.call_count == 3
+    smtp_servers[0].quit.assert_called_once()
+
+
+def test_failed_login_closes_socket_and_send_returns_false(tmp_path):
+    """Test auth failures close the socket and surface as False."""
+    with mock.patch("smtplib.SMTP") as factory:
+        factory.return_value.login.side_effect = smtplib.SMTPAuthenticationError(535, b"denied")
+        with make_notifier() as notifier:
+            assert not notifier.send_report_email(**report_email(tmp_path))
+
+    assert factory.return_value.close.call_count == 2  # __enter__ and the one-off retry
+
+
+def test_deliver_sends_crlf_bytes_to_explicit_recipients(smtp_servers, tmp_path):
+    """Test the message is serialized once with CRLF endings for sendmail."""
+    args = report_email(tmp_path)
+    assert make_notifier().send_report_email(**args)
+
+    sender, recipients, raw = smtp_servers[0].sendmail.call_args.args
+    assert sender == "sender@example.com"
+    assert recipients == args["recipient_emails"]
+    assert isinstance(raw, bytes)
+    assert b"\r\n" in raw
+    assert b"\n" not in raw.replace(b"\r\n", b"")
+    assert b"Subject: Startup Research Report - run_1\r\n" in raw
+
+
+@pytest.mark.parametrize("size", [
+    0, 1, 56, 57, 58,
+    ATTACHMENT_CHUNK_SIZE - 1, ATTACHMENT_CHUNK_SIZE, ATTACHMENT_CHUNK_SIZE + 1,
+    2 * ATTACHMENT_CHUNK_SIZE + 57,
+])
+def test_encode_base64_chunked_round_trips(size):
+    """Test chunked encoding decodes to the input and keeps MIME line lengths."""
+    data = os.urandom(size)
+    encoded = EmailNotifier._encode_base64_chunked(io.BytesIO(data))
+
+    assert encoded == base64.encodebytes(data).decode("ascii")
+    assert base64.b64decode(encoded) == data
+    assert all(len(line) <= 76 for line in encoded.splitlines())
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_attach_files_round_trips(tmp_path, compress):
+    """Test attached report files decode (and gunzip) back to their contents."""
+    content = os.urandom(3 * ATTACHMENT_CHUNK_SIZE // 2)
+    (tmp_path / "agents_summary.json").write_bytes(content)
+    (tmp_path / "events.jsonl").write_bytes(b"{}\n")
+
+    msg = MIMEMultipart()
+    EmailNotifier(compress_attachments=compress)._attach_files(msg, tmp_path)
+
+    [part] = msg.get_payload()
+    payload = part.get_payload(decode=True)
+    if compress:
+        assert part.get_filename() == "agents_summary.json.gz"
+        payload = gzip.decompress(payload)
+    else:
+        assert part.get_filename() == "agents_summary.json"
+    assert payload == content
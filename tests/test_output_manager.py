@@ -0,0 +1,33 @@
+"""Tests for output file generation."""
+
+import csv
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.output_manager import OutputManager
+
+
+def test_save_csv_export_sorted_columns(tmp_path):
+    """Test CSV columns are the sorted union of keys, with blanks for missing ones."""
+    manager = OutputManager("run_1", output_dir=tmp_path)
+    path = manager.save_csv_export([
+        {'name': 'Acme', 'website': 'https://acme.com', 'india_fit_score': 80},
+        {'name': 'Beta', 'category': 'AI', 'primary_tier': None},
+    ])
+
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+
+    assert rows == [
+        ['category', 'india_fit_score', 'name', 'primary_tier', 'website'],
+        ['', '80', 'Acme', '', 'https://acme.com'],
+        ['AI', '', 'Beta', '', ''],
+    ]
+
+
+def test_save_csv_export_empty(tmp_path):
+    """Test nothing is written when there are no startups."""
+    assert OutputManager("run_1", output_dir=tmp_path).save_csv_export([]) is None
@@ -0,0 +1,109 @@
+"""Tests for the singleflight call coalescer."""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cache.singleflight import singleflight
+
+
+class CountingStub:
+    """Callable that records calls and blocks until released."""
+
+    def __init__(self, result="page", error=None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self, key):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return f"{self.result}:{key}" if self.result else self.result
+
+
+def run_concurrently(func, args, release, workers=8):
+    """Call func with each arg from its own thread, then release the stub.
+
+    Returns:
+        Per-call result or raised exception, in input order
+    """
+    def call(arg):
+        try:
+            return func(arg)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(call, arg) for arg in args]
+        time.sleep(0.1)  # let every caller reach the coalescing point
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_concurrent_callers_share_one_call():
+    """Test concurrent identical calls run the function once."""
+    stub = CountingStub()
+    stub.release.clear()
+    shared = singleflight(lambda key: key)(stub)
+
+    assert run_concurrently(shared, ["a"] * 8, stub.release) == ["page:a"] * 8
+    assert stub.calls == 1
+
+    # Later calls are served from the memo
+    assert shared("a") == "page:a"
+    assert stub.calls == 1
+
+
+def test_exceptions_reach_every_waiter_and_are_not_cached():
+    """Test a failure propagates to all waiters and the next call retries."""
+    stub = CountingStub(error=ValueError("boom"))
+    stub.release.clear()
+    shared = singleflight(lambda key: key)(stub)
+
+    outcomes = run_concurrently(shared, ["a"] * 8, stub.release)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert stub.calls == 1
+
+    with pytest.raises(ValueError):
+        shared("a")
+    assert stub.calls == 2
+
+
+def test_empty_results_are_not_cached():
+    """Test empty results (failed requests) are fetched again."""
+    stub = CountingStub(result="")
+    shared = singleflight(lambda key: key)(stub)
+
+    assert shared("a") == ""
+    assert shared("a") == ""
+    assert stub.calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the memo holds at most maxsize results, evicting the oldest."""
+    stub = CountingStub()
+    shared = singleflight(lambda key: key, maxsize=2)(stub)
+
+    shared("a")
+    shared("b")
+    shared("a")  # refresh "a" so "b" is now the oldest
+    shared("c")  # evicts "b"
+    assert stub.calls == 3
+
+    shared("a")
+    assert stub.calls == 3
+    shared("b")
+    assert stub.calls == 4
@@ -1,9 +1,10 @@
 """Tests for utility functions."""
 
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -11,120 +12,185 @@ from src.tools.search_tools import (
     generate_hash,
     fuzzy_match,
     is_duplicate,
+    build_name_index,
+    Deduper,
+    find_duplicates,
     DEDUPLICATION_THRESHOLD
 )
+from src.database.db import startup_name_hash
+from src.utils.agent_output import extract_json, parse_agent_json, merge_results
+
+EXISTING = [
+    {"name": "TechStartup", "website": "https://tech.com"},
+    {"name": "OtherStartup", "website": "https://other.com"}
+]
+
+
+def test_generate_hash():
+    """Test hash generation."""
+    hash1 = generate_hash("TechStartup", "https://tech.com", "2024-11-01")
+    hash2 = generate_hash("TechStartup", "https://tech.com", "2024-11-01")
+
+    # Same inputs should produce same hash
+    assert hash1 == hash2
+
+    # Different inputs should produce different hash
+    hash3 = generate_hash("OtherStartup", "https://other.com", "2024-11-02")
+    assert hash1 != hash3
+
+    # Field boundaries are part of the key
+    assert generate_hash("Tech", "startup.com", "2024") != generate_hash("TechStartup", ".com", "2024")
+    assert generate_hash("a|b", "c", "2024") != generate_hash("a", "b|c", "2024")
+
+
+def test_hash_consistency_across_calls():
+    """Test that hash is consistent across multiple calls."""
+    hashes = {generate_hash("StartupXYZ", "https://startup.com", "2024-11-01") for _ in range(5)}
+
+    # All hashes should be identical
+    assert len(hashes) == 1
+
+
+def test_hash_length():
+    """Test that hash is 64-bit xxh3 (16 hex characters)."""
+    hash_val = generate_hash("Test", "https://test.com", "2024-11-01")
+    assert len(hash_val) == 16
+
+
+@pytest.mark.parametrize("str1, str2, threshold, expected", [
+    ("TechStartup", "TechStartup", DEDUPLICATION_THRESHOLD, True),        # exact
+    ("TechStartup", "Tech Startup", 0.85, True),                          # similar
+    ("TechStartup", "CompletelyDifferent", 0.85, False),                  # different
+    ("TECHSTARTUP", "techstartup", DEDUPLICATION_THRESHOLD, True),        # case insensitive
+    ("TechStartup", "Tech", 0.95, False),                                 # high threshold is strict
+    ("TechStartup", "Tech", 0.30, True),                                  # low threshold is lenient
+])
+def test_fuzzy_match(str1, str2, threshold, expected):
+    """Test fuzzy matching across similarity levels and thresholds."""
+    assert fuzzy_match(str1, str2, threshold=threshold) is expected
+
+
+@pytest.mark.parametrize("name, existing, expected", [
+    ("NewStartup", [], False),            # empty list
+    ("Tech Startup", EXISTING, True),     # duplicate exists
+    ("NewStartup", EXISTING, False),      # no duplicate
+])
+def test_is_duplicate(name, existing, expected):
+    """Test is_duplicate against empty, matching and non-matching lists."""
+    assert is_duplicate(name, existing) is expected
+
+
+def test_is_duplicate_normalized_exact():
+    """Test is_duplicate matches names differing only in case/punctuation."""
+    existing = [{"name": "Acme, Inc."}, {"name": "OtherStartup"}]
+    name_index = build_name_index(existing)
+    assert is_duplicate("ACME inc", existing, name_index=name_index)
+    assert not is_duplicate("Acme Labs", existing, name_index=name_index)
+
+    # Precomputed lowercased names drive the fuzzy fallback
+    names_lower = [s["name"].lower() for s in EXISTING]
+    assert is_duplicate("TECHSTARTUPS", EXISTING, names_lower=names_lower)
+
+
+def test_find_duplicates():
+    """Test batch duplicate flags keep input order."""
+    result = find_duplicates(["Tech Startup", "NewStartup", "otherstartup"], EXISTING)
+    assert result == [True, False, True]
+
+
+def test_deduper_add():
+    """Test Deduper accepts novel names and rejects exact/fuzzy repeats."""
+    deduper = Deduper(["TechStartup"])
+    assert not deduper.add("tech-startup")
+    assert not deduper.add("TechStartups")
+    assert deduper.add("OtherStartup")
+    assert not deduper.add("OtherStartup")
+    assert len(deduper) == 2
+
+
+def test_deduper_add_non_latin():
+    """Test Deduper keeps distinct non-Latin names apart."""
+    deduper = Deduper()
+    assert deduper.add("字节跳动")
+    assert deduper.add("😀")
+    assert deduper.add("Яндекс")
+    assert not deduper.add("яндекс")
+
+
+def test_deduper_add_prehashed():
+    """Test Deduper reuses a caller-supplied name hash."""
+    deduper = Deduper()
+    assert deduper.add("Acme, Inc.", name_hash=startup_name_hash("Acme, Inc."))
+    assert not deduper.add("acme inc")
+    assert len(deduper) == 1
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('[{"name": "Acme"}]', [{"name": "Acme"}]),                                  # pure JSON
+    ('```json\n{"name": "Acme", "score": 80}\n```', {"name": "Acme", "score": 80}),  # fenced block
+    ('Here are the results:\n[{"name": "Acme"}]\nDone.', [{"name": "Acme"}]),      # prose before
+    ('Draft [incomplete, final: {"startups": [1, 2]}', {"startups": [1, 2]}),      # stray bracket
+    ('{"a": {"b": [1, {"c": 2}]}} trailing', {"a": {"b": [1, {"c": 2}]}}),         # nested
+    ('No structured output this time.', None),                                    # no JSON
+    ('', None),
+])
+def test_extract_json(text, expected):
+    """Test JSON is found in pure, fenced, prefixed and malformed agent output."""
+    assert extract_json(text) == expected
+
+
+@pytest.mark.parametrize("output, names", [
+    ('[{"name": "Acme"}, {"name": "Beta"}]', ["Acme", "Beta"]),                  # list
+    ('{"startups": [{"name": "Acme"}]}', ["Acme"]),                              # wrapped list
+    ('{"top_opportunities": [{"startup_name": "Acme"}]}', ["Acme"]),
+    ('{"name": "Acme", "score": 70}', ["Acme"]),                                 # single item
+    ('{"Acme": {"score": 70}, "Beta": {"tier": "Tier 2"}}', ["Acme", "Beta"]),  # keyed by name
+    ('not json', []),
+])
+def test_parse_agent_json_shapes(output, names):
+    """Test every supported agent output shape yields its startups."""
+    startups = parse_agent_json(output)['startups']
+    assert [s.get('name') or s.get('startup_name') for s in startups] == names
+
+
+def test_parse_agent_json_aliases():
+    """Test alias keys map onto canonical tier and fit fields."""
+    parsed = parse_agent_json(
+        '[{"startup_name": "Acme", "tier": "Tier 1", "secondary_tier": ["Tier 3"],'
+        ' "reason": "fits", "score": 88, "analysis": "strong"},'
+        ' {"name": "Beta", "india_fit_score": 40, "india_fit_analysis": "weak"}]'
+    )
+    assert parsed['tiers'] == {
+        'Acme': {'primary_tier': 'Tier 1', 'secondary_tiers': ['Tier 3'], 'reasoning': 'fits'}
+    }
+    assert parsed['fits'] == {
+        'Acme': {'score': 88, 'analysis': 'strong'},
+        'Beta': {'score': 40, 'analysis': 'weak'},
+    }
+
+
+def test_merge_results_by_position():
+    """Test analyses attach by index, even when the model renames the startup."""
+    startups = [{'name': 'Acme, Inc.'}, {'name': 'Beta'}, {'name': 'Gamma', 'india_fit_score': 30}]
+    fit_outputs = ['{"name": "Acme Inc.", "score": 80}', None, 'unparseable']
+    tier_outputs = [None, '{"name": "beta", "tier": "Tier 2"}', None]
+
+    records = merge_results(startups, fit_outputs, tier_outputs)
+
+    assert [r['name'] for r in records] == ['Acme, Inc.', 'Beta', 'Gamma']
+    assert records[0]['india_fit_score'] == 80
+    assert 'primary_tier' not in records[0]
+    assert records[1]['primary_tier'] == 'Tier 2'
+    assert 'india_fit_score' not in records[1]
+    assert records[2]['india_fit_score'] == 30  # falls back to the discovery data
+    assert records[0]['hash'] == startup_name_hash('Acme, Inc.')
 
 
-class TestDeduplication(unittest.TestCase):
-    """Test deduplication functions."""
-    
-    def test_generate_hash(self):
-        """Test hash generation."""
-        hash1 = generate_hash("TechStartup", "https://tech.com", "2024-11-01")
-        hash2 = generate_hash("TechStartup", "https://tech.com", "2024-11-01")
-        
-        # Same inputs should produce same hash
-        self.assertEqual(hash1, hash2)
-        
-        # Different inputs should produce different hash
-        hash3 = generate_hash("OtherStartup", "https://other.com", "2024-11-02")
-        self.assertNotEqual(hash1, hash3)
-        
-        print("✅ test_generate_hash passed")
-    
-    def test_fuzzy_match_exact(self):
-        """Test fuzzy matching with exact match."""
-        result = fuzzy_match("TechStartup", "TechStartup")
-        self.assertTrue(result)
-        print("✅ test_fuzzy_match_exact passed")
-    
-    def test_fuzzy_match_similar(self):
-        """Test fuzzy matching with similar strings."""
-        # Should match with high similarity
-        result = fuzzy_match("TechStartup", "Tech Startup", threshold=0.85)
-        self.assertTrue(result)
-        print("✅ test_fuzzy_match_similar passed")
-    
-    def test_fuzzy_match_different(self):
-        """Test fuzzy matching with different strings."""
-        result = fuzzy_match("TechStartup", "CompletelyDifferent", threshold=0.85)
-        self.assertFalse(result)
-        print("✅ test_fuzzy_match_different passed")
-    
-    def test_fuzzy_match_case_insensitive(self):
-        """Test fuzzy matching is case insensitive."""
-        result = fuzzy_match("TECHSTARTUP", "techstartup")
-        self.assertTrue(result)
-        print("✅ test_fuzzy_match_case_insensitive passed")
-    
-    def test_is_duplicate_empty_list(self):
-        """Test is_duplicate with empty list."""
-        result = is_duplicate("NewStartup", [])
-        self.assertFalse(result)
-        print("✅ test_is_duplicate_empty_list passed")
-    
-    def test_is_duplicate_found(self):
-        """Test is_duplicate when duplicate exists."""
-        existing = [
-            {"name": "TechStartup", "website": "https://tech.com"},
-            {"name": "OtherStartup", "website": "https://other.com"}
-        ]
-        result = is_duplicate("Tech Startup", existing)
-        self.assertTrue(result)
-        print("✅ test_is_duplicate_found passed")
-    
-    def test_is_duplicate_not_found(self):
-        """Test is_duplicate when no duplicate exists."""
-        existing = [
-            {"name": "TechStartup", "website": "https://tech.com"},
-            {"name": "OtherStartup", "website": "https://other.com"}
-        ]
-        result = is_duplicate("NewStartup", existing)
-        self.assertFalse(result)
-        print("✅ test_is_duplicate_not_found passed")
-
-
-class TestHashConsistency(unittest.TestCase):
-    """Test hash consistency."""
-    
-    def test_hash_consistency_across_calls(self):
-        """Test that hash is consistent across multiple calls."""
-        name = "StartupXYZ"
-        website = "https://startup.com"
-        date = "2024-11-01"
-        
-        hashes = [generate_hash(name, website, date) for _ in range(5)]
-        
-        # All hashes should be identical
-        self.assertTrue(all(h == hashes[0] for h in hashes))
-        print("✅ test_hash_consistency_across_calls passed")
-    
-    def test_hash_length(self):
-        """Test that hash is MD5 (32 characters)."""
-        hash_val = generate_hash("Test", "https://test.com", "2024-11-01")
-        self.assertEqual(len(hash_val), 32)
-        print("✅ test_hash_length passed")
-
-
-class TestFuzzyMatchThreshold(unittest.TestCase):
-    """Test fuzzy matching with different thresholds."""
-    
-    def test_threshold_high(self):
-        """Test with high threshold."""
-        # High threshold should be strict
-        result = fuzzy_match("TechStartup", "Tech", threshold=0.95)
-        self.assertFalse(result)
-        print("✅ test_threshold_high passed")
-    
-    def test_threshold_low(self):
-        """Test with low threshold."""
-        # Low threshold should be lenient
-        result = fuzzy_match("TechStartup", "Tech", threshold=0.30)
-        self.assertTrue(result)
-        print("✅ test_threshold_low passed")
-
-
-if __name__ == "__main__":
-    # Run tests with verbose output
-    unittest.main(verbosity=2)
+def test_merge_results_shorter_outputs():
+    """Test startups beyond a shorter output list are kept without that analysis."""
+    startups = [{'name': 'Acme'}, {'startup_name': 'Beta'}, {'description': 'no name'}]
+    records = merge_results(startups, ['{"score": 75, "name": "Acme"}'], [])
 
+    assert [r['name'] for r in records] == ['Acme', 'Beta']
+    assert records[0]['india_fit_score'] == 75
+    assert 'india_fit_score' not in records[1]